@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the finance indicator overlays (widgets/indicators.py)
+
+Times one full computation and then the per-update cost of the two updates a
+live chart sees: the forming bar changing, and a new bar being appended while
+the oldest one drops off. Incremental updates should cost about the same
+whatever the history length; a from-scratch recompute grows with it.
+
+Usage: python benchmark_indicators.py [--updates 200]
+"""
+
+import argparse
+import time
+import numpy as np
+from widgets.indicators import IndicatorSet
+
+HISTORY_LENGTHS = (1_000, 10_000, 100_000, 1_000_000)
+SETTINGS = dict(sma=(20, 50), ema=(12, 26), vwap=True, day_range=True, changes=('1d', '5d'))
+
+
+def synthetic_bars(length, seed=0):
+    """Hourly random-walk bars"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, length))
+    return {
+        'time': 1.7e9 + np.arange(length) * 3600.0,
+        'close': close,
+        'high': close + rng.uniform(0, 1, length),
+        'low': close - rng.uniform(0, 1, length),
+        'volume': rng.integers(100, 10_000, length).astype(float),
+    }
+
+
+def window(bars, start, stop):
+    # Views, so building the series costs nothing next to the indicators
+    return {name: values[start:stop] for name, values in bars.items()}
+
+
+def median_us(samples):
+    return float(np.median(samples)) * 1e6
+
+
+def benchmark(length, updates):
+    bars = synthetic_bars(length + updates)
+    indicators = IndicatorSet(**SETTINGS)
+
+    started = time.perf_counter()
+    indicators.update(window(bars, 0, length))
+    full_ms = (time.perf_counter() - started) * 1000
+
+    forming, appended = [], []
+    rng = np.random.default_rng(1)
+    for step in range(updates):
+        # A tick moves the forming bar...
+        bars['close'][length + step - 1] += rng.normal(0, 0.05)
+        started = time.perf_counter()
+        indicators.update(window(bars, step, length + step))
+        forming.append(time.perf_counter() - started)
+
+        # ...then the next bar opens and the oldest one leaves the window
+        started = time.perf_counter()
+        indicators.update(window(bars, step + 1, length + step + 1))
+        appended.append(time.perf_counter() - started)
+
+    # The same updates recomputed from scratch, for comparison
+    started = time.perf_counter()
+    IndicatorSet(**SETTINGS).update(window(bars, updates, length + updates))
+    scratch_ms = (time.perf_counter() - started) * 1000
+    return full_ms, median_us(forming), median_us(appended), scratch_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--updates', type=int, default=200, help='updates timed per history length')
+    args = parser.parse_args()
+
+    print("📈 Indicator update cost (SMA 20/50, EMA 12/26, VWAP, day range, 1d/5d change)")
+    print("-" * 78)
+    print(f"{'bars':>10} {'first full':>12} {'forming bar':>14} {'new bar':>12} {'from scratch':>14}")
+    for length in HISTORY_LENGTHS:
+        full_ms, forming_us, appended_us, scratch_ms = benchmark(length, args.updates)
+        print(f"{length:>10,} {full_ms:>9.2f} ms {forming_us:>11.1f} µs "
+              f"{appended_us:>9.1f} µs {scratch_ms:>11.2f} ms")
+    print("-" * 78)
+    print("✅ Incremental columns should stay flat while 'from scratch' grows with history")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,32 +4,61 @@ from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
-from kivy.clock import Clock
 from kivy.config import Config
+import json
+import time
 
 # Config.set('graphics', 'fullscreen', 'auto')  # or '1' for always fullscreen
 # Config.set('graphics', 'resizable', False)    # Optional: make window fixed-size
 
-from widgets.weather import WeatherWidget
 from widgets.clock import ClockWidget
 from widgets.coloredbox import ColoredBox  # ← import the wrapper
-from widgets.quote import QuoteWidget
-from widgets.finance import FinanceWidget
-from widgets.system_monitor import SystemMonitorWidget
-from widgets.news import NewsWidget
-from widgets.calendar_widget import CalendarWidget
 from widgets.config_manager import ConfigManager
+from widgets.fetch_executor import fetch_executor
+from widgets.performance_config import load_performance_config
+from widgets.scheduler import UpdateScheduler
+from widgets.registry import WidgetRegistry
+from widgets.snapshot import StateSnapshot
+from widgets.startup import StartupPipeline
+from widgets.circuit_breaker import breakers
+from widgets.chart_renderer import chart_renderer
+from widgets.http_cache import http_cache
 
 class Dashboard(BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'horizontal'
+        self.launched_at = time.monotonic()
         
+        # Widget plugins are imported on demand by the registry
+        self.widget_registry = WidgetRegistry()
+
         # Initialize configuration manager
         self.config_manager = ConfigManager(self)
+
+        # One scheduler drives every periodic update, using performance_config.json
+        self.performance_config = load_performance_config()
+        self.scheduler = UpdateScheduler(
+            self.performance_config['update_intervals'],
+            coalesce_window=self.performance_config['scheduler']['coalesce_window']
+        )
+
+        # Last known widget data, restored before the first frame
+        snapshot_settings = self.performance_config['snapshot']
+        self.snapshot = StateSnapshot(snapshot_settings['path']) if snapshot_settings['enabled'] else None
+
+        # Per-upstream circuit breakers; state is mirrored to a file for performance_monitor.py
+        breakers.configure(**self.performance_config['circuit_breaker'])
+
+        # Two-tier HTTP cache shared by the network widgets, with per-source TTLs
+        http_cache.configure(**self.performance_config['http_cache'],
+                             ttls=self.performance_config['cache_settings'])
+
+        # Initial updates run after the window is shown, network widgets staggered
+        self.startup = StartupPipeline(**self.performance_config['startup'])
         
         # LEFT SIDE: big clock
-        self.clock_widget = ClockWidget()
+        self.clock_widget = ClockWidget(**self.performance_config['clock'])
         self.clock_container = BoxLayout(size_hint=(0.5, 1))
         self.clock_widget.render(self.clock_container)
 
@@ -49,149 +78,173 @@ class Dashboard(BoxLayout):
         
         # Build dashboard from configuration
         self.build_from_config()
+        self.widget_registry.report()
         
         self.add_widget(self.clock_container)
         self.add_widget(self.grid_container)
         self.add_widget(self.config_button)
 
-        # Optimized update scheduling
+        # Unified update scheduling
         self.setup_update_schedule()
-        
-        # Trigger immediate updates for all widgets
-        self.trigger_initial_updates()
 
     def setup_update_schedule(self):
-        """Setup different update intervals for different widgets"""
-        # Clock updates every second
-        Clock.schedule_interval(self.update_clock, 1)
-        
-        # Weather updates every 5 minutes (300 seconds)
-        Clock.schedule_interval(self.update_weather, 300)
-        
-        # Finance updates every 2 minutes (120 seconds)
-        Clock.schedule_interval(self.update_finance, 120)
-        
-        # System monitor updates every 10 seconds
-        Clock.schedule_interval(self.update_system, 10)
-        
-        # News updates every 10 minutes (600 seconds)
-        Clock.schedule_interval(self.update_news, 600)
-        
-        # Calendar updates every 5 minutes
-        Clock.schedule_interval(self.update_calendar, 300)
-        
-        # Quote updates every 30 minutes (1800 seconds)
-        Clock.schedule_interval(self.update_quote, 1800)
-
-    def trigger_initial_updates(self):
-        """Trigger immediate updates for all widgets on startup"""
-        print("Triggering initial widget updates...")
-        
-        # Update clock immediately
-        self.clock_widget.update()
-        
-        # Update all grid widgets immediately
+        """Start the clock and register every grid widget with the unified scheduler"""
+        # The clock re-arms itself on wall-clock second boundaries instead of a fixed interval
+        self.clock_widget.start()
         for widget in self.grid_widgets:
-            if hasattr(widget, 'update'):
-                # Force update by resetting last_update time
-                if hasattr(widget, 'last_update'):
-                    widget.last_update = 0
-                widget.update()
-
-    def update_clock(self, dt):
-        """Update clock widget"""
-        self.clock_widget.update()
-
-    def update_weather(self, dt):
-        """Update weather widgets"""
-        for widget in self.grid_widgets:
-            if isinstance(widget, WeatherWidget):
-                widget.update()
+            self._schedule_widget(widget)
 
-    def update_finance(self, dt):
-        """Update finance widgets"""
-        for widget in self.grid_widgets:
-            if isinstance(widget, FinanceWidget):
-                widget.update()
+        if self.snapshot:
+            self.scheduler.add('snapshot', self.snapshot, callback=self.save_snapshot,
+                               interval=self.performance_config['snapshot']['save_interval'])
 
-    def update_system(self, dt):
-        """Update system monitor widgets"""
-        for widget in self.grid_widgets:
-            if isinstance(widget, SystemMonitorWidget):
-                widget.update()
+    def _schedule_widget(self, widget):
+        """Schedule a grid widget using its interval from performance_config.json"""
+        interval = self.scheduler.intervals.get(widget.widget_type)
+        if interval and hasattr(widget, 'update_interval'):
+            # Keep the widget's own cache throttle in step with the configured interval
+            widget.update_interval = interval
+        self.scheduler.add(widget.widget_type, widget)
 
-    def update_news(self, dt):
-        """Update news widgets"""
-        for widget in self.grid_widgets:
-            if isinstance(widget, NewsWidget):
-                widget.update()
+    def start(self):
+        """Kick off initial updates once the first frame is on screen"""
+        from kivy.core.window import Window
+        Window.bind(on_flip=self._on_first_frame)
 
-    def update_calendar(self, dt):
-        """Update calendar widgets"""
-        for widget in self.grid_widgets:
-            if isinstance(widget, CalendarWidget):
-                widget.update()
+    def _on_first_frame(self, *args):
+        from kivy.core.window import Window
+        Window.unbind(on_flip=self._on_first_frame)
+        self.trigger_initial_updates(started_at=self.launched_at)
+
+    def trigger_initial_updates(self, started_at=None, widgets=None):
+        """Run the first update of every widget (or just `widgets`) through the startup pipeline"""
+        print("Triggering initial widget updates...")
+
+        if widgets is None:
+            entries = [('clock', 'clock', self.clock_widget)]
+            widgets = self.grid_widgets
+        else:
+            entries = []
+        entries += [(widget.slot_key, widget.widget_type, widget) for widget in widgets]
+        self.startup.run(entries, self._initial_update, started_at=started_at)
+
+    def _initial_update(self, widget):
+        # Force the update, unless the widget was restored from a snapshot and
+        # its own throttle says it's still fresh
+        if hasattr(widget, 'last_update'):
+            widget.update(force=not getattr(widget, 'stale', False))
+        else:
+            widget.update()
 
-    def update_quote(self, dt):
-        """Update quote widgets"""
+    def save_snapshot(self):
+        """Persist every grid widget's last good payload"""
+        if not self.snapshot:
+            return
         for widget in self.grid_widgets:
-            if isinstance(widget, QuoteWidget):
-                widget.update()
+            self.snapshot.capture(widget.slot_key, widget)
+        self.snapshot.save()
 
     def build_from_config(self):
-        """Build dashboard based on configuration"""
-        # Clear existing widgets
-        self.grid_container.clear_widgets()
-        self.grid_widgets = []
-        
+        """Build the grid from configuration, reusing widgets that are still configured.
+
+        Existing instances are kept (and moved or recolored as needed) when their type
+        is still in the layout, so they keep their cached data. Returns the newly
+        created widgets.
+        """
         # Get enabled widgets from config
         enabled_widgets = self.config_manager.get_enabled_widgets()
         
         # Sort by position
         enabled_widgets.sort(key=lambda x: x['position'])
+
+        # Pool current widgets by type and options so they can be reused in any slot
+        reusable = {}
+        for widget in self.grid_widgets:
+            reusable.setdefault(widget.reuse_key, []).append(widget)
+
+        # Detach everything; widget instances survive and are re-added below
+        self.grid_container.clear_widgets()
+        self.grid_widgets = []
+        created = []
         
-        # Create widgets for the first 4 positions
+        # Fill the first 4 positions
         for i in range(4):
             if i < len(enabled_widgets):
                 widget_config = enabled_widgets[i]
-                widget = self._create_widget(widget_config['type'])
+                widget_type = widget_config['type']
+                options = widget_config.get('options', {})
+                color = tuple(widget_config['color'])
+                reuse_key = (widget_type, json.dumps(options, sort_keys=True))
+
+                widget = self._take_reusable(reusable, reuse_key, i)
                 if widget:
+                    widget.colored_box.set_color(color)
+                else:
+                    widget = self._create_widget(widget_type, options)
+                    if not widget:
+                        continue
                     widget.size_hint = (1, 1)
-                    
+                    widget.widget_type = widget_type
+                    widget.reuse_key = reuse_key
+
                     # Wrap in colored box
-                    color = tuple(widget_config['color'])
                     wrapped = ColoredBox(widget, color=color)
                     wrapped.size_hint = (1, 1)
-                    
-                    self.grid_container.add_widget(wrapped)
-                    self.grid_widgets.append(widget)
+                    widget.colored_box = wrapped
+                    created.append(widget)
+
+                widget.slot_index = i
+                widget.slot_key = StateSnapshot.slot_key(i, widget_type)
+                if widget in created and self.snapshot:
+                    self.snapshot.restore(widget.slot_key, widget)
+
+                self.grid_container.add_widget(widget.colored_box)
+                self.grid_widgets.append(widget)
             else:
                 # Add placeholder for empty slots
                 placeholder = BoxLayout()
                 placeholder.size_hint = (1, 1)
                 self.grid_container.add_widget(placeholder)
 
-    def _create_widget(self, widget_type):
-        """Create widget based on type"""
-        widget_creators = {
-            'weather': lambda: WeatherWidget(),
-            'quote': lambda: QuoteWidget(),
-            'finance': lambda: FinanceWidget("QQQ"),
-            'system_monitor': lambda: SystemMonitorWidget(),
-            'news': lambda: NewsWidget(),
-            'calendar': lambda: CalendarWidget()
-        }
-        
-        creator = widget_creators.get(widget_type)
-        if creator:
-            return creator()
-        return None
+        # Tear down widgets that are no longer configured
+        for widgets in reusable.values():
+            for widget in widgets:
+                self._teardown_widget(widget)
+
+        return created
+
+    def _take_reusable(self, reusable, reuse_key, slot_index):
+        """Pop an existing matching widget, preferring the one already in this slot"""
+        candidates = reusable.get(reuse_key)
+        if not candidates:
+            return None
+        for widget in candidates:
+            if widget.slot_index == slot_index:
+                candidates.remove(widget)
+                return widget
+        return candidates.pop(0)
+
+    def _teardown_widget(self, widget):
+        """Unschedule a removed widget and drop its in-flight fetches"""
+        if self.snapshot:
+            self.snapshot.capture(widget.slot_key, widget)
+        self.scheduler.remove(widget)
+        fetch_executor.cancel(widget)
+        if hasattr(widget, 'release'):
+            widget.release()
+
+    def _create_widget(self, widget_type, options=None):
+        """Create widget based on type and its per-widget options from the config"""
+        return self.widget_registry.create(widget_type, **(options or {}))
 
     def rebuild_from_config(self):
-        """Rebuild dashboard from configuration"""
-        self.build_from_config()
-        # Trigger immediate updates after rebuild
-        self.trigger_initial_updates()
+        """Apply configuration changes, only creating or destroying what changed"""
+        created = self.build_from_config()
+        for widget in created:
+            self._schedule_widget(widget)
+        # Only new widgets need an initial update
+        if created:
+            self.trigger_initial_updates(widgets=created)
 
     def show_config(self, instance):
         """Show configuration popup"""
@@ -201,5 +254,14 @@ class DashboardApp(App):
     def build(self):
         return Dashboard()
 
+    def on_start(self):
+        self.root.start()
+
+    def on_stop(self):
+        self.root.save_snapshot()
+        fetch_executor.shutdown()
+        chart_renderer.stop()
+        http_cache.stop()
+
 if __name__ == '__main__':
     DashboardApp().run()
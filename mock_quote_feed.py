@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for a streaming quote feed, for testing and benchmarking the
+finance widgets' streaming mode ("stream": true)
+
+Usage: python mock_quote_feed.py [--port 8765] [--rate 10] [--batch]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import websockets
+
+# Rough starting prices; unknown symbols start at 100
+START_PRICES = {
+    'SPY': 580.0,
+    'QQQ': 500.0,
+    'DIA': 430.0,
+    'IWM': 220.0,
+    'AAPL': 230.0,
+    'MSFT': 420.0,
+    'NVDA': 130.0,
+    'AMZN': 190.0,
+}
+
+
+class MockQuoteFeed:
+    def __init__(self, rate=10, batch=False, stats_interval=10):
+        self.rate = rate  # Trades per second per subscribed symbol
+        self.batch = batch  # Send each round of trades as one JSON list
+        self.stats_interval = stats_interval
+        self.prices = dict(START_PRICES)
+        self.clients = 0
+        self.messages = 0
+        self.bytes_sent = 0
+
+    def _trade(self, symbol):
+        # Random walk with a little drift back toward the starting price
+        price = self.prices.get(symbol, 100.0)
+        start = START_PRICES.get(symbol, 100.0)
+        price += price * random.gauss(0, 0.0004) + (start - price) * 0.001
+        self.prices[symbol] = price
+        return {
+            'symbol': symbol,
+            'price': round(price, 2),
+            'size': random.choice((1, 5, 10, 50, 100, 200, 500)),
+            'time': time.time(),
+        }
+
+    async def _send(self, ws, payload):
+        message = json.dumps(payload)
+        await ws.send(message)
+        self.messages += 1
+        self.bytes_sent += len(message)
+
+    async def handle(self, ws):
+        """Serve one client: read subscriptions, stream trades for them"""
+        symbols = []
+        self.clients += 1
+        print(f"🔌 Client connected ({self.clients} total)")
+
+        async def read_subscriptions():
+            async for message in ws:
+                request = json.loads(message)
+                if request.get('action') == 'subscribe':
+                    symbols[:] = request.get('symbols', [])
+                    print(f"📈 Subscribed: {', '.join(symbols) or '(none)'}")
+
+        reader = asyncio.create_task(read_subscriptions())
+        try:
+            while not reader.done():
+                await asyncio.sleep(1.0 / self.rate)
+                trades = [self._trade(symbol) for symbol in symbols]
+                if not trades:
+                    continue
+                if self.batch:
+                    await self._send(ws, trades)
+                else:
+                    for trade in trades:
+                        await self._send(ws, trade)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            reader.cancel()
+            self.clients -= 1
+            print(f"👋 Client disconnected ({self.clients} total)")
+
+    async def report(self):
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            if self.messages:
+                print(f"📊 {self.messages / self.stats_interval:7.1f} msg/s, "
+                      f"{self.bytes_sent / self.stats_interval / 1024:6.1f} KB/s "
+                      f"to {self.clients} client(s)")
+            self.messages = 0
+            self.bytes_sent = 0
+
+
+async def serve(host, port, feed):
+    async with websockets.serve(feed.handle, host, port):
+        print(f"🚀 Mock quote feed on ws://{host}:{port} ({feed.rate} trades/s per symbol)")
+        print("Press Ctrl+C to stop")
+        await feed.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rate', type=float, default=10, help='trades per second per symbol')
+    parser.add_argument('--batch', action='store_true', help='send each round as one JSON list')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, MockQuoteFeed(rate=args.rate, batch=args.batch)))
+    except KeyboardInterrupt:
+        print("\n🛑 Mock quote feed stopped")
+
+if __name__ == "__main__":
+    main()
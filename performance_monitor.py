@@ -7,11 +7,15 @@ import psutil
 import time
 import threading
 from datetime import datetime
+from widgets.circuit_breaker import read_breaker_status
+from widgets.performance_config import load_performance_config
 
 class PerformanceMonitor:
     def __init__(self):
         self.monitoring = True
         self.stats = []
+        # Circuit breaker state written by the running dashboard
+        self.breaker_status_file = load_performance_config()['circuit_breaker']['status_file']
         
     def start_monitoring(self):
         """Start monitoring system performance"""
@@ -57,6 +61,10 @@ class PerformanceMonitor:
                       f"RAM: {memory.percent:5.1f}% (Python: {total_python_memory:5.1f}%) | "
                       f"Disk: {disk.percent:5.1f}% | "
                       f"Python processes: {len(python_processes)}")
+
+                breaker_line = self.format_breakers()
+                if breaker_line:
+                    print(f"           Breakers: {breaker_line}")
                 
                 time.sleep(5)  # Update every 5 seconds
                 
@@ -64,6 +72,22 @@ class PerformanceMonitor:
             print("\n🛑 Monitoring stopped by user")
             self.print_summary()
     
+    def format_breakers(self):
+        """One-line summary of the dashboard's upstream circuit breakers"""
+        status = read_breaker_status(self.breaker_status_file)
+        if not status or not status.get('breakers'):
+            return None
+
+        parts = []
+        for name, breaker in sorted(status['breakers'].items()):
+            text = f"{name}={breaker['state']}"
+            if breaker['state'] == 'open' and breaker.get('retry_at'):
+                text += f" (probe in {max(0, breaker['retry_at'] - time.time()):.0f}s)"
+            elif breaker['failures']:
+                text += f" ({breaker['failures']} failures)"
+            parts.append(text)
+        return ", ".join(parts)
+
     def print_summary(self):
         """Print performance summary"""
         if not self.stats:
@@ -98,6 +98,381 @@ def test_psutil():
         print(f"❌ psutil error: {e}")
         return False
 
+def test_fetch_executor():
+    """Test that background fetches report back on the main thread"""
+    import threading
+    import time
+    from kivy.clock import Clock
+    from widgets.fetch_executor import FetchExecutor
+
+    executor = FetchExecutor(max_workers=2)
+    results = []
+    main_thread = threading.current_thread()
+
+    executor.submit('ok', lambda: 42,
+                    on_success=lambda r: results.append(('ok', r, threading.current_thread() is main_thread)))
+    executor.submit('slow', lambda: time.sleep(0.5), timeout=0.1,
+                    on_success=lambda r: results.append(('slow', r, True)),
+                    on_error=lambda e: results.append(('slow', type(e).__name__, True)))
+    executor.submit('cancelled', lambda: 1, on_success=lambda r: results.append(('cancelled', r, True)))
+    executor.cancel('cancelled')
+
+    def tick(seconds):
+        deadline = time.time() + seconds
+        while time.time() < deadline:
+            Clock.tick()
+            time.sleep(0.01)
+
+    tick(0.3)
+    assert ('slow', 'TimeoutError', True) in results
+    # The timed-out call still holds a worker, so its owner can't submit again yet
+    assert executor.is_busy('slow')
+    tick(0.7)
+    executor.shutdown()
+
+    assert ('ok', 42, True) in results
+    assert not any(r[0] == 'slow' and r[1] is None for r in results)
+    assert not executor.is_busy('slow')
+    assert not any(r[0] == 'cancelled' for r in results)
+    assert not executor.is_busy('ok')
+    print("✅ Fetch executor delivers, times out and cancels correctly")
+    return True
+
+def test_update_scheduler():
+    """Test that due updates within the slack window share one wake-up"""
+    from widgets.scheduler import UpdateScheduler
+
+    class Target:
+        def __init__(self):
+            self.calls = 0
+            self.forced = False
+            self.last_update = 123
+
+        def update(self, force=False):
+            self.calls += 1
+            self.forced = force
+
+    scheduler = UpdateScheduler({'a': 10, 'b': 10, 'c': 60}, coalesce_window=2.0)
+    a, b, c = Target(), Target(), Target()
+    scheduler.add('a', a, delay=0)
+    scheduler.add('b', b, delay=0.5)  # within slack of 'a', so coalesced
+    scheduler.add('c', c, delay=30)
+    scheduler._wake(0)
+
+    assert (a.calls, b.calls, c.calls) == (1, 1, 0)
+    assert scheduler.wakeups == 1 and scheduler.runs == 2
+    # Scheduler bypasses the widget's own throttle without losing the fetch time
+    assert a.forced and a.last_update == 123
+
+    scheduler.remove(c)
+    scheduler.clear()
+    assert scheduler.add('unknown', Target()) is None
+    print("✅ Update scheduler coalesces due updates into one wake-up")
+    return True
+
+def test_circuit_breaker():
+    """Test that the breaker opens, backs off and half-opens with one probe"""
+    from widgets.circuit_breaker import CircuitBreaker
+
+    breaker = CircuitBreaker('test', failure_threshold=2, base_delay=10, jitter=0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow_request()
+
+    # Backoff elapsed: exactly one probe goes through
+    breaker.retry_at = 0
+    assert breaker.allow_request() and breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    # Failed probe reopens with a doubled delay
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert 19 < breaker.retry_in() <= 20
+
+    # A probe that never reports back (cancelled fetch) reopens the circuit
+    breaker.retry_at = 0
+    assert breaker.allow_request()
+    breaker.probe_deadline = 0
+    assert not breaker.allow_request() and breaker.state == CircuitBreaker.OPEN
+
+    breaker.retry_at = 0
+    breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow_request()
+    print("✅ Circuit breaker opens, backs off and recovers")
+    return True
+
+def test_price_buffer():
+    """Test that the ring buffer merges, dedupes and drops the oldest bars"""
+    from widgets.price_series import PriceBuffer
+
+    buffer = PriceBuffer(capacity=4)
+    assert buffer.merge([1, 2, 3], {'close': [10, 20, 30]}) == 3
+
+    # Bar 3 was still forming: the overlap overwrites it, bars 4-5 are new
+    assert buffer.merge([3, 4, 5], {'close': [31, 40, 50]}) == 2
+    series = buffer.series()
+    assert series['time'].tolist() == [2, 3, 4, 5]
+    assert series['close'].tolist() == [20, 31, 40, 50]
+    assert buffer.last_time == 5
+
+    assert buffer.series(since=4)['close'].tolist() == [40, 50]
+    print("✅ Price buffer merges incremental bars")
+    return True
+
+def test_price_store():
+    """Test that the on-disk store appends, overwrites, backfills, compacts and reopens"""
+    import tempfile
+    import time
+    from widgets.price_store import PriceStore
+
+    now = time.time() // 3600 * 3600
+    def hours(*offsets):
+        return [now + offset * 3600 for offset in offsets]
+
+    with tempfile.TemporaryDirectory() as path:
+        store = PriceStore(path=path, retention_days=30)
+        assert store.merge('QQQ', '1h', hours(-3, -2, -1), {'close': [1, 2, 3]}) == 3
+
+        # Bar -1 was still forming: it is overwritten in place, bar 0 is appended
+        assert store.merge('QQQ', '1h', hours(-1, 0), {'close': [31, 40]}) == 1
+        assert store.read('QQQ', '1h')['close'].tolist() == [1, 2, 31, 40]
+
+        # Older history is prepended by rewriting the column files
+        assert store.merge('QQQ', '1h', hours(-6, -5, -4), {'close': [-6, -5, -4]}) == 3
+        assert store.read('QQQ', '1h')['close'].tolist() == [-6, -5, -4, 1, 2, 31, 40]
+
+        # Bars well past retention are compacted away straight after the write
+        store.merge('QQQ', '1h', hours(-40 * 24), {'close': [0]})
+        assert store.span('QQQ', '1h') == (hours(-6)[0], now)
+
+        reopened = PriceStore(path=path, retention_days=30)
+        assert reopened.span('QQQ', '1h') == (hours(-6)[0], now)
+        series = reopened.read('QQQ', '1h', since=hours(-1)[0])
+        assert series['time'].tolist() == hours(-1, 0)
+        assert series['close'].tolist() == [31, 40]
+        assert reopened.span('SPY', '1h') is None
+    print("✅ Price store appends, backfills, compacts and reopens")
+    return True
+
+def test_market_hours():
+    """Test that polling sleeps through closures and resumes at the open"""
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+    from widgets.market_hours import MarketCalendar, REGULAR, CLOSED
+
+    calendar = MarketCalendar(holidays=["2026-11-26"])
+    tz = ZoneInfo('America/New_York')
+    def at(*args):
+        return datetime(*args, tzinfo=tz).timestamp()
+
+    assert calendar.session(at(2026, 10, 16, 10, 0)) == REGULAR
+    assert calendar.next_poll_delay(120, at(2026, 10, 16, 10, 0)) == 120
+
+    # Saturday noon: next poll is Monday's open
+    saturday = at(2026, 10, 17, 12, 0)
+    assert calendar.session(saturday) == CLOSED
+    assert saturday + calendar.next_poll_delay(120, saturday) == at(2026, 10, 19, 9, 30)
+
+    # Thanksgiving is skipped
+    evening = at(2026, 11, 25, 18, 0)
+    assert evening + calendar.next_poll_delay(120, evening) == at(2026, 11, 27, 9, 30)
+    print("✅ Market hours pause polling outside sessions")
+    return True
+
+def test_indicators():
+    """Test that incremental indicator updates match a from-scratch computation"""
+    import numpy as np
+    from widgets.indicators import IndicatorSet
+
+    settings = dict(sma=(5,), ema=(4,), vwap=True, day_range=True, changes=('1d',))
+    times = 1.7e9 + np.arange(100) * 3600.0
+    close = 100 + np.sin(np.arange(100) / 5.0)
+    series = {'time': times, 'close': close, 'high': close + 1, 'low': close - 1,
+              'volume': np.full(100, 10.0)}
+
+    incremental = IndicatorSet(**settings)
+    for end in range(10, 100):
+        results = incremental.update({name: values[:end] for name, values in series.items()})
+    results = incremental.update(series)
+    assert incremental.computed_bars == 2  # The last held bar plus the new one
+
+    expected = IndicatorSet(**settings).update(series)
+    for name, values in expected['overlays'].items():
+        assert np.allclose(results['overlays'][name], values, equal_nan=True), name
+    assert results['stats'] == expected['stats']
+    print("✅ Indicators update incrementally")
+    return True
+
+def test_finance_batch():
+    """Test that one download is split per symbol, with full and incremental fetches"""
+    import tempfile
+    import time
+    import numpy as np
+    import pandas as pd
+    import widgets.finance as finance
+    from widgets.performance_config import load_performance_config
+    from widgets.price_store import price_store
+
+    now = time.time() // 3600 * 3600
+    calls = []
+
+    def download(symbols, **kwargs):
+        """Stands in for yf.download(group_by='ticker'): (ticker, field) columns"""
+        calls.append((list(symbols), kwargs.get('period'), 'start' in kwargs))
+        index = pd.to_datetime(now + np.arange(-5, 1) * 3600, unit='s', utc=True)
+        frames = {}
+        for symbol in symbols:
+            close = {'AAA': 100.0, 'BBB': 200.0}[symbol] + np.arange(6)
+            if symbol == 'BBB':
+                close[0] = np.nan  # Not trading in the first hour of the shared index
+            frames[symbol] = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1,
+                                           'Close': close, 'Volume': 10.0}, index=index)
+        return pd.concat(frames, axis=1)
+
+    real_download = finance.yf.download
+    finance.yf.download = download
+    try:
+        with tempfile.TemporaryDirectory() as path:
+            provider = finance.YFinanceProvider()
+            price_store.configure(path=path)
+            watchlist, chart = object(), object()
+            provider.watch(watchlist, ['AAA', 'BBB'], lambda data: None)
+            provider.watch(chart, ['AAA'], lambda data: None, history=31 * 86400)
+
+            # First fetch: full downloads, one per range; only the charted symbol goes back a month
+            provider._on_success(provider.fetch(*provider.fetch_args()))
+            assert calls == [(['BBB'], '7d', False), (['AAA'], '31d', False)]
+            assert provider.data['AAA']['close'].tolist() == [100, 101, 102, 103, 104, 105]
+            assert provider.data['BBB']['time'].tolist() == list(now + np.arange(-4, 1) * 3600)
+            assert provider.data['BBB']['high'].tolist() == [202, 203, 204, 205, 206]
+
+            # Second fetch: one incremental download for both symbols
+            provider._on_success(provider.fetch(*provider.fetch_args()))
+            assert calls[2] == (['AAA', 'BBB'], None, True)
+            assert (provider.full_fetches, provider.incremental_fetches) == (2, 1)
+    finally:
+        finance.yf.download = real_download
+        price_store.configure(**load_performance_config()['price_store'])
+    print("✅ Finance batch splits per symbol and fetches incrementally")
+    return True
+
+def test_weather_batch():
+    """Test that one Open-Meteo call for every location is split back per location"""
+    import numpy as np
+    from widgets.weather import OpenMeteoProvider
+
+    class Values:
+        def __init__(self, value):
+            self.value = value
+
+        def Value(self):
+            return self.value
+
+        def ValuesAsNumpy(self):
+            return np.full(24, self.value, dtype=np.float32)
+
+    class Series:
+        def __init__(self, *values):
+            self.values = values
+
+        def Variables(self, i):
+            return Values(self.values[i])
+
+        def Time(self):
+            return 0
+
+        def Interval(self):
+            return 3600
+
+    class Response:
+        def __init__(self, celsius):
+            self.celsius = celsius
+
+        def Current(self):
+            return Series(self.celsius, 50, self.celsius, 3, 0)
+
+        def Hourly(self):
+            return Series(self.celsius, 0.5)
+
+        def Daily(self):
+            return Series(self.celsius + 5, self.celsius - 5)
+
+        def UtcOffsetSeconds(self):
+            return 0
+
+    class Client:
+        """Stands in for openmeteo_requests.Client: one response per requested location"""
+        def __init__(self, drop=0):
+            self.drop = drop
+            self.params = None
+
+        def weather_api(self, url, params):
+            self.params = params
+            latitudes = params['latitude'].split(',')
+            return [Response(float(latitude)) for latitude in latitudes[self.drop:]]
+
+    provider = OpenMeteoProvider()
+    provider.client = Client()
+    boston, denver = object(), object()
+    provider.watch(boston, 10, -71, lambda data: None)
+    provider.watch(denver, 20, -105, lambda data: None)
+
+    conditions = provider.fetch(*provider.fetch_args())
+    assert provider.client.params['latitude'] == '10,20'
+    assert provider.client.params['longitude'] == '-71,-105'
+    assert 'hourly' not in provider.client.params
+    assert conditions[(10, -71)]['temp'] == 50 and conditions[(20, -105)]['temp'] == 68
+    assert 'forecast' not in conditions[(10, -71)]
+
+    # A forecast strip adds hourly/daily values to the same request
+    provider.watch(denver, 20, -105, lambda data: None, forecast=True)
+    conditions = provider.fetch(*provider.fetch_args())
+    assert provider.client.params['hourly'] and provider.client.params['daily']
+    forecast = conditions[(20, -105)]['forecast']
+    assert forecast['hourly_temp'][0] == 20 and forecast['daily_high'][0] == 25
+
+    # A reply that doesn't match the locations asked for is an error, not a mix-up
+    provider.client = Client(drop=1)
+    try:
+        provider.fetch(*provider.fetch_args())
+        assert False, "short reply accepted"
+    except ValueError:
+        pass
+    print("✅ Weather batch maps responses back to locations")
+    return True
+
+def test_http_cache():
+    """Test that repeat lookups stay in memory and the disk tier survives a restart"""
+    import os
+    import tempfile
+    from widgets.http_cache import CachedResponse, HttpCache
+
+    with tempfile.TemporaryDirectory() as path:
+        cache = HttpCache(path=path, memory_entries=1, eviction_interval=0,
+                          ttls={'news_cache': 60})
+        response = CachedResponse('https://example.com/a', 200, b'{"a": 1}', 'application/json')
+        cache.put('https://example.com/a', response, cache.ttl_for('news'))
+
+        assert cache.get('https://example.com/a').json() == {'a': 1}
+        assert cache.memory_hits == 1 and cache.disk_hits == 0
+        assert cache.get('https://example.com/b') is None
+        assert cache.misses == 1
+
+        # A fresh cache (as after a restart) finds the response on disk
+        restarted = HttpCache(path=path, eviction_interval=0)
+        assert restarted.get('https://example.com/a').json() == {'a': 1}
+        assert restarted.disk_hits == 1
+
+        # Room for one response only: the write itself evicts the older one
+        small = HttpCache(path=path, max_disk_megabytes=0.0001, eviction_interval=0)
+        small.put('https://example.com/b', response, 60)
+        assert small.evictions == 1 and len(os.listdir(path)) == 1
+        assert small.get('https://example.com/b') is not None
+    print("✅ HTTP cache serves memory and disk hits")
+    return True
+
 if __name__ == "__main__":
     print("🧪 Testing Raspberry Pi Dashboard Widgets")
     print("=" * 50)
@@ -113,6 +488,46 @@ if __name__ == "__main__":
     # Test psutil
     print("\n💻 Testing psutil functionality...")
     psutil_ok = test_psutil()
+
+    # Test background fetch executor
+    print("\n🧵 Testing fetch executor...")
+    executor_ok = test_fetch_executor()
+
+    # Test unified update scheduler
+    print("\n⏱️  Testing update scheduler...")
+    scheduler_ok = test_update_scheduler()
+
+    # Test circuit breaker
+    print("\n🔌 Testing circuit breaker...")
+    breaker_ok = test_circuit_breaker()
+
+    # Test price ring buffer
+    print("\n📈 Testing price buffer...")
+    buffer_ok = test_price_buffer()
+
+    # Test on-disk price history
+    print("\n💾 Testing price store...")
+    store_ok = test_price_store()
+
+    # Test market-hours polling
+    print("\n🏦 Testing market hours...")
+    market_ok = test_market_hours()
+
+    # Test incremental indicators
+    print("\n📉 Testing indicators...")
+    indicators_ok = test_indicators()
+
+    # Test the batched finance download
+    print("\n💹 Testing finance batch...")
+    finance_ok = test_finance_batch()
+
+    # Test the batched weather request
+    print("\n🌦️ Testing weather batch...")
+    weather_ok = test_weather_batch()
+
+    # Test the two-tier HTTP cache
+    print("\n🗄️ Testing HTTP cache...")
+    http_cache_ok = test_http_cache()
     
     # Summary
     print("\n" + "=" * 50)
@@ -120,8 +535,20 @@ if __name__ == "__main__":
     print(f"   Imports: {'✅ PASS' if imports_ok else '❌ FAIL'}")
     print(f"   Creation: {'✅ PASS' if creation_ok else '❌ FAIL'}")
     print(f"   psutil: {'✅ PASS' if psutil_ok else '❌ FAIL'}")
+    print(f"   Executor: {'✅ PASS' if executor_ok else '❌ FAIL'}")
+    print(f"   Scheduler: {'✅ PASS' if scheduler_ok else '❌ FAIL'}")
+    print(f"   Breaker: {'✅ PASS' if breaker_ok else '❌ FAIL'}")
+    print(f"   Price buffer: {'✅ PASS' if buffer_ok else '❌ FAIL'}")
+    print(f"   Price store: {'✅ PASS' if store_ok else '❌ FAIL'}")
+    print(f"   Market hours: {'✅ PASS' if market_ok else '❌ FAIL'}")
+    print(f"   Indicators: {'✅ PASS' if indicators_ok else '❌ FAIL'}")
+    print(f"   Finance batch: {'✅ PASS' if finance_ok else '❌ FAIL'}")
+    print(f"   Weather batch: {'✅ PASS' if weather_ok else '❌ FAIL'}")
+    print(f"   HTTP cache: {'✅ PASS' if http_cache_ok else '❌ FAIL'}")
     
-    if imports_ok and creation_ok and psutil_ok:
+    if all([imports_ok, creation_ok, psutil_ok, executor_ok, scheduler_ok, breaker_ok, buffer_ok,
+            store_ok, market_ok, indicators_ok, finance_ok,
+            weather_ok, http_cache_ok]):
         print("\n🎉 All tests passed! Dashboard should work properly.")
     else:
         print("\n⚠️  Some tests failed. Check the errors above.") 
\ No newline at end of file
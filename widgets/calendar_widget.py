@@ -68,7 +68,7 @@ class CalendarWidget(BoxLayout):
         parent.add_widget(self)
         self.update()
 
-    def update(self):
+    def update(self, force=False):
         current_time = time.time()
         
         # Skip cache check on first update or if forced
@@ -77,7 +77,7 @@ class CalendarWidget(BoxLayout):
             self.last_update = 0  # Force update
         
         # Only update if enough time has passed
-        if current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
+        if not force and current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
             return
             
         try:
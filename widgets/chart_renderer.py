@@ -0,0 +1,191 @@
+# widgets/chart_renderer.py
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from kivy.clock import Clock
+
+
+class ChartRenderer:
+    """Renders matplotlib charts in a worker process so the UI never holds the GIL for it.
+
+    Each chart owns a shared memory frame of width * height * 4 bytes. A render
+    request sends the series and pixel size through a pipe; the worker draws
+    with Agg straight into the frame and replies, and the UI thread only blits
+    the frame into a texture. One render per chart is in flight at a time, and
+    newer requests replace any still waiting behind it.
+
+    The worker is spawned on the first render and restarted (with its in-flight
+    requests re-sent) if it dies or stops answering within `render_timeout`.
+    """
+
+    def __init__(self, render_timeout=30, poll_interval=0.05, max_attempts=2):
+        self.render_timeout = render_timeout
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts  # Renders tried per request before giving up on it
+        self.restarts = 0
+
+        self._process = None
+        self._connection = None
+        self._frames = {}  # chart id -> SharedMemory
+        self._in_flight = {}  # chart id -> [request, on_frame, sent_at, attempts]
+        self._waiting = {}  # chart id -> (request, on_frame) queued behind the in-flight one
+        self._poll_event = None
+
+    def render(self, chart_id, title, theme, times, close, overlays, size, on_frame):
+        """Render a chart; on_frame(pixels, size) is called on the UI thread"""
+        request = {
+            'chart': chart_id,
+            'title': title,
+            'theme': theme,
+            'times': times,
+            'close': close,
+            'overlays': overlays,
+            'size': (int(size[0]), int(size[1])),
+        }
+        if chart_id in self._in_flight:
+            self._waiting[chart_id] = (request, on_frame)
+            return
+        self._send(request, on_frame)
+
+    def release(self, chart_id):
+        """Drop a chart's frame and figure, e.g. when its widget is removed"""
+        self._waiting.pop(chart_id, None)
+        self._in_flight.pop(chart_id, None)  # A late reply for it is ignored
+        frame = self._frames.pop(chart_id, None)
+        if frame is not None:
+            frame.close()
+            frame.unlink()
+        if self._connection is not None:
+            try:
+                self._connection.send({'chart': chart_id, 'release': True})
+            except OSError:
+                pass
+
+    def stop(self):
+        """Stop the worker and free every frame"""
+        for chart_id in list(self._frames):
+            self.release(chart_id)
+        self._stop_worker()
+
+    def _frame_for(self, chart_id, size):
+        """Shared memory frame big enough for `size`, reallocated when the size changes"""
+        needed = size[0] * size[1] * 4
+        frame = self._frames.get(chart_id)
+        if frame is not None and frame.size < needed:
+            # Never in flight here: one render per chart at a time
+            frame.close()
+            frame.unlink()
+            frame = None
+        if frame is None:
+            frame = shared_memory.SharedMemory(create=True, size=needed)
+            self._frames[chart_id] = frame
+        return frame
+
+    def _start_worker(self):
+        # Spawn rather than fork: a forked copy of the UI process would inherit
+        # Kivy's GL state and any locks held by fetch threads
+        from widgets.chart_worker import render_loop
+        context = multiprocessing.get_context('spawn')
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(target=render_loop, args=(child_connection,),
+                                        name='chart-renderer', daemon=True)
+        self._process.start()
+        child_connection.close()
+        print(f"[ChartRenderer] Started render worker (pid {self._process.pid})")
+
+    def _stop_worker(self):
+        if self._poll_event is not None:
+            self._poll_event.cancel()
+            self._poll_event = None
+        if self._process is None:
+            return
+        try:
+            self._connection.send(None)
+        except OSError:
+            pass
+        self._process.join(timeout=2)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._connection.close()
+        self._process = None
+        self._connection = None
+
+    def _send(self, request, on_frame, attempts=0):
+        if self._process is None:
+            self._start_worker()
+        request['frame'] = self._frame_for(request['chart'], request['size']).name
+        self._in_flight[request['chart']] = [request, on_frame, time.monotonic(), attempts + 1]
+        try:
+            self._connection.send(request)
+        except OSError:
+            pass  # Worker gone; the next poll restarts it and re-sends
+        if self._poll_event is None:
+            self._poll_event = Clock.schedule_interval(self._poll, self.poll_interval)
+
+    def _poll(self, dt):
+        """Deliver finished frames; restart the worker if it died or hung (UI thread)"""
+        if self._connection is None:
+            self._poll_event.cancel()
+            self._poll_event = None
+            return
+        try:
+            while self._connection.poll():
+                self._on_reply(self._connection.recv())
+        except (EOFError, OSError):
+            pass  # Worker died mid-reply; handled below
+
+        if self._in_flight:
+            oldest = min(sent_at for _, _, sent_at, _ in self._in_flight.values())
+            hung = time.monotonic() - oldest > self.render_timeout
+            if hung or not self._process.is_alive():
+                self._restart('stopped answering' if hung else 'crashed')
+        elif self._poll_event is not None:
+            # Nothing left to wait for
+            self._poll_event.cancel()
+            self._poll_event = None
+
+    def _on_reply(self, reply):
+        chart_id = reply['chart']
+        entry = self._in_flight.pop(chart_id, None)
+        if entry is None:
+            return  # Released while rendering
+        on_frame = entry[1]
+        if 'error' in reply:
+            print(f"[ChartRenderer] Render failed: {reply['error']}")
+        else:
+            width, height = reply['size']
+            # Release the view straight after the blit, or the frame can't be closed later
+            with self._frames[chart_id].buf[:width * height * 4] as pixels:
+                on_frame(pixels, (width, height))
+
+        waiting = self._waiting.pop(chart_id, None)
+        if waiting is not None:
+            self._send(*waiting)
+
+    def _restart(self, reason):
+        in_flight = list(self._in_flight.values())
+        self._in_flight.clear()
+        if self._process is not None:
+            self._process.kill()
+            self._process.join(timeout=2)
+            self._connection.close()
+        self._process = None
+        self._connection = None
+        self.restarts += 1
+        print(f"[ChartRenderer] Render worker {reason}, restarting")
+
+        for request, on_frame, _, attempts in in_flight:
+            chart_id = request['chart']
+            if attempts >= self.max_attempts:
+                # This request keeps killing the worker; keep showing the last frame
+                print(f"[ChartRenderer] Giving up on a render after {attempts} attempts")
+                waiting = self._waiting.pop(chart_id, None)
+                if waiting is not None:
+                    self._send(*waiting)
+            else:
+                self._send(request, on_frame, attempts)
+
+
+# Shared render worker for the matplotlib finance charts
+chart_renderer = ChartRenderer()
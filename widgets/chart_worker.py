@@ -0,0 +1,144 @@
+# widgets/chart_worker.py
+
+# Runs in the chart render process: no Kivy imports here
+import time
+import warnings
+from multiprocessing import shared_memory
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
+import numpy as np
+
+DPI = 100
+EPOCH_DATENUM = mdates.date2num(np.datetime64('1970-01-01'))
+
+# Chart "theme" option -> colors
+CHART_THEMES = {
+    'light': {'figure': 'white', 'axes': '#f8f9fa', 'text': 'black', 'up': 'green', 'down': 'red'},
+    'dark': {'figure': '#1e1e1e', 'axes': '#262626', 'text': '#dddddd', 'up': '#4caf50', 'down': '#ef5350'},
+}
+
+
+class ChartFigure:
+    """One finance chart's Figure, Axes and lines, reused for every render"""
+
+    def __init__(self, title, theme='light'):
+        if theme not in CHART_THEMES:
+            print(f"[ChartWorker] Unknown chart theme '{theme}', using light")
+            theme = 'light'
+        self.colors = colors = CHART_THEMES[theme]
+        # Figure + Agg canvas directly: no pyplot global state to reset or close
+        self.figure = Figure(dpi=DPI, facecolor=colors['figure'])
+        FigureCanvasAgg(self.figure)
+        self.size = None
+        self.overlay_lines = {}  # Indicator name -> Line2D
+
+        ax = self.figure.add_subplot()
+        self.line, = ax.plot([], [], linewidth=2, alpha=0.8)
+        ax.xaxis_date()
+
+        # Add subtle grid
+        ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+
+        # Format title and labels
+        ax.set_title(title, fontsize=10, fontweight='bold', pad=10, color=colors['text'])
+        ax.set_ylabel('Price ($)', fontsize=8, fontweight='bold', color=colors['text'])
+
+        # Format axis ticks
+        ax.tick_params(axis='both', which='major', labelsize=7, colors=colors['text'])
+        ax.tick_params(axis='x', rotation=45)
+
+        # Format y-axis to show currency
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f'${x:.0f}'))
+
+        # Remove top and right spines for cleaner look
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_alpha(0.7)
+        ax.spines['bottom'].set_alpha(0.7)
+        ax.spines['left'].set_color(colors['text'])
+        ax.spines['bottom'].set_color(colors['text'])
+
+        # Add subtle background color
+        ax.set_facecolor(colors['axes'])
+        self.axes = ax
+
+    def render(self, times, close, overlays, size):
+        """Draw the series at `size` pixels; returns the Agg canvas"""
+        dates = times / 86400.0 + EPOCH_DATENUM
+        self.line.set_data(dates, close)
+        self.line.set_color(self.colors['up'] if close[-1] >= close[0] else self.colors['down'])
+        for name, values in overlays.items():
+            line = self.overlay_lines.get(name)
+            if line is None:
+                line, = self.axes.plot([], [], linewidth=1, alpha=0.7, label=name)
+                self.overlay_lines[name] = line
+                self.axes.legend(loc='upper left', fontsize=6, frameon=False,
+                                 labelcolor=self.colors['text'])
+            line.set_data(dates, values)
+        self.axes.relim()
+        self.axes.autoscale_view()
+
+        if size != self.size:
+            self.figure.set_size_inches(size[0] / DPI, size[1] / DPI)
+            # Margins depend on tick label sizes, which barely move between updates
+            with warnings.catch_warnings():
+                # Tiny tiles can't fit every label; draw them as well as we can
+                warnings.simplefilter('ignore', UserWarning)
+                self.figure.tight_layout(pad=1.0)
+            self.size = size
+
+        self.figure.canvas.draw()
+        return self.figure.canvas
+
+
+def render_loop(connection):
+    """Serve render requests from the UI process until it hangs up.
+
+    Requests: {'chart', 'title', 'theme', 'times', 'close', 'overlays', 'size', 'frame'} to
+    render into the named shared memory frame, or {'chart', 'release': True}.
+    Replies: {'chart', 'size', 'seconds'} once the frame holds the pixels, or
+    {'chart', 'error'}.
+    """
+    charts = {}  # chart id -> ChartFigure
+    frames = {}  # chart id -> attached SharedMemory
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        chart_id = request['chart']
+        if request.get('release'):
+            charts.pop(chart_id, None)
+            frame = frames.pop(chart_id, None)
+            if frame is not None:
+                frame.close()
+            continue
+
+        try:
+            started = time.perf_counter()
+            chart = charts.get(chart_id)
+            if chart is None:
+                chart = charts[chart_id] = ChartFigure(request['title'], request['theme'])
+            canvas = chart.render(request['times'], request['close'],
+                                  request['overlays'], request['size'])
+
+            frame = frames.get(chart_id)
+            if frame is None or frame.name != request['frame']:
+                if frame is not None:
+                    frame.close()
+                # Spawned workers share the UI's resource tracker, and the UI unlinks frames
+                frame = frames[chart_id] = shared_memory.SharedMemory(name=request['frame'])
+            # buffer_rgba() is a view onto Agg's own pixel memory; one copy into the frame
+            pixels = memoryview(canvas.buffer_rgba()).cast('B')
+            frame.buf[:len(pixels)] = pixels
+            connection.send({'chart': chart_id, 'size': canvas.get_width_height(),
+                             'seconds': time.perf_counter() - started})
+        except Exception as e:
+            connection.send({'chart': chart_id, 'error': repr(e)})
@@ -0,0 +1,154 @@
+# widgets/circuit_breaker.py
+
+import json
+import os
+import random
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Health tracker for one upstream service.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests
+    are refused for an exponentially growing, jittered delay. When the delay runs
+    out the circuit half-opens and lets a single probe through: success closes it,
+    failure opens it again with a longer delay. A probe that never reports back
+    (e.g. its fetch was cancelled) counts as failed after `probe_timeout` seconds.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold=3, base_delay=30, max_delay=1800, jitter=0.2,
+                 probe_timeout=60, on_change=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.probe_timeout = probe_timeout
+        self.on_change = on_change
+
+        self.state = self.CLOSED
+        self.failures = 0  # Consecutive failures
+        self.trips = 0  # Consecutive times the circuit has opened, drives the backoff
+        self.retry_at = 0
+        self.probe_deadline = 0
+
+    def allow_request(self):
+        """True if a request may go upstream now"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and time.time() >= self.probe_deadline:
+            # The probe's result was lost; treat it as failed rather than wait forever
+            print(f"[CircuitBreaker] {self.name} probe never reported back")
+            self._open()
+        if self.state == self.OPEN and time.time() >= self.retry_at:
+            # Let exactly one probe through
+            self.probe_deadline = time.time() + self.probe_timeout
+            self._set_state(self.HALF_OPEN)
+            return True
+        return False
+
+    def retry_in(self):
+        """Seconds until the next probe is allowed (0 when closed)"""
+        if self.state != self.OPEN:
+            return 0
+        return max(0, self.retry_at - time.time())
+
+    def record_success(self):
+        had_failures = self.failures
+        self.failures = 0
+        self.trips = 0
+        if self.state != self.CLOSED:
+            self._set_state(self.CLOSED)
+        elif had_failures and self.on_change:
+            self.on_change(self)
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._open()
+        elif self.on_change:
+            # Still closed, but the monitor shows the failure count too
+            self.on_change(self)
+
+    def _open(self):
+        self.trips += 1
+        delay = min(self.max_delay, self.base_delay * 2 ** (self.trips - 1))
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.retry_at = time.time() + delay
+        print(f"[CircuitBreaker] {self.name} open, next probe in {delay:.0f}s")
+        self._set_state(self.OPEN)
+
+    def _set_state(self, state):
+        changed = state != self.state
+        self.state = state
+        if self.on_change and (changed or state == self.OPEN):
+            self.on_change(self)
+
+    def status(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'retry_at': self.retry_at if self.state == self.OPEN else None,
+        }
+
+
+class BreakerBoard:
+    """One circuit breaker per upstream, with an optional status file for monitoring"""
+
+    def __init__(self):
+        self.settings = {}
+        self.status_file = None
+        self._breakers = {}
+
+    def configure(self, status_file=None, **settings):
+        """Apply performance_config.json settings to current and future breakers"""
+        self.status_file = status_file
+        self.settings = settings
+        for breaker in self._breakers.values():
+            for name, value in settings.items():
+                setattr(breaker, name, value)
+
+    def get(self, name):
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, on_change=self._on_change, **self.settings)
+            self._breakers[name] = breaker
+        return breaker
+
+    def status(self):
+        return {name: breaker.status() for name, breaker in self._breakers.items()}
+
+    def _on_change(self, breaker):
+        # State and failure count changes are rare, so writing the file each time is cheap
+        if not self.status_file:
+            return
+        try:
+            tmp_path = self.status_file + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'updated_at': time.time(), 'breakers': self.status()}, f)
+            os.replace(tmp_path, self.status_file)
+        except Exception as e:
+            print(f"Error writing breaker status: {e}")
+
+
+def read_breaker_status(path):
+    """Load the status file written by BreakerBoard (for the performance monitor)"""
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"Error reading breaker status: {e}")
+    return None
+
+
+# Shared breakers used by all data providers
+breakers = BreakerBoard()
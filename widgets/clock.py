@@ -1,85 +1,273 @@
-from kivy.uix.label import Label
 from datetime import datetime
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Ellipse, Line
+from kivy.graphics import Color, Ellipse, Line, InstructionGroup, Rectangle
+from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
+from kivy.properties import NumericProperty, StringProperty
 import math
+import re
+import time
 
 
 class AnalogClockFace(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.bind(pos=self.update_clock, size=self.update_clock)
         self.time = datetime.now()
+        self.smooth = False  # Sweep the second hand instead of stepping it
+
+        # Static face (ellipse, outline, hour marks) lives in its own group and is
+        # only rebuilt when the widget moves or resizes
+        self.face = InstructionGroup()
+        self.canvas.add(self.face)
+
+        # Hands are created once; each tick only rewrites their points
+        with self.canvas:
+            Color(0.1, 0.1, 0.1, 1)
+            self.hour_hand = Line(points=[0, 0, 0, 0], width=4)
+            Color(0.2, 0.2, 0.2, 1)
+            self.minute_hand = Line(points=[0, 0, 0, 0], width=3)
+            Color(1, 0, 0, 1)
+            self.second_hand = Line(points=[0, 0, 0, 0], width=1.5)
+
+            # Center dot drawn over the hands
+            Color(0, 0, 0, 1)
+            self.center_dot = Ellipse(pos=(0, 0), size=(10, 10))
+
+        self.bind(pos=self.update_clock, size=self.update_clock)
+        self.update_clock()
 
     def set_time(self, dt):
         self.time = dt
-        self.update_clock()
+        self.update_hands()
 
     def update_clock(self, *args):
-        self.canvas.clear()
+        """Rebuild the static face for the current pos/size, then place the hands"""
         cx, cy = self.center
         radius = min(self.width, self.height) * 0.45
 
+        self.face.clear()
+        # Draw clock face
+        self.face.add(Color(0.95, 0.95, 0.95, 1))
+        self.face.add(Ellipse(pos=(cx - radius, cy - radius), size=(2*radius, 2*radius)))
+        self.face.add(Color(0.2, 0.2, 0.2, 1))
+        self.face.add(Line(circle=(cx, cy, radius), width=2))
+
+        # Draw hour marks
+        for i in range(12):
+            angle = math.radians(i * 30)
+            x1 = cx + (radius - 8) * math.sin(angle)
+            y1 = cy + (radius - 8) * math.cos(angle)
+            x2 = cx + (radius - 20) * math.sin(angle)
+            y2 = cy + (radius - 20) * math.cos(angle)
+            self.face.add(Line(points=[x1, y1, x2, y2], width=2))
+
+        self.center_dot.pos = (cx - 5, cy - 5)
+        self.update_hands()
+
+    def update_hands(self):
+        """Move the three hands in place (the only per-tick canvas work)"""
+        cx, cy = self.center
+        radius = min(self.width, self.height) * 0.45
+
+        now = self.time
+        hour = now.hour % 12 + now.minute / 60.0
+        minute = now.minute + now.second / 60.0
+        second = now.second + now.microsecond / 1e6 if self.smooth else now.second
+
+        # Hour hand
+        hour_angle = math.radians(90 - (hour * 30))
+        self.hour_hand.points = [cx, cy,
+                                 cx + (radius * 0.5) * math.cos(hour_angle),
+                                 cy + (radius * 0.5) * math.sin(hour_angle)]
+
+        # Minute hand
+        min_angle = math.radians(90 - (minute * 6))
+        self.minute_hand.points = [cx, cy,
+                                   cx + (radius * 0.75) * math.cos(min_angle),
+                                   cy + (radius * 0.75) * math.sin(min_angle)]
+
+        # Second hand
+        sec_angle = math.radians(90 - (second * 6))
+        self.second_hand.points = [cx, cy,
+                                   cx + (radius * 0.85) * math.cos(sec_angle),
+                                   cy + (radius * 0.85) * math.sin(sec_angle)]
+
+class DigitalClockLabel(Widget):
+    """Clock readout composed from cached glyph textures.
+
+    Each glyph (0-9, ':', ' ', AM, PM) is rasterized once at the current font size.
+    A tick only swaps the texture on the cells whose character changed, so setting
+    `text` every second causes no re-layout or texture upload.
+    """
+
+    text = StringProperty('')
+    font_size = NumericProperty('40sp')
+
+    def __init__(self, **kwargs):
+        self._glyphs = {}  # token -> texture
+        self._cells = []  # Rectangle per token
+        self._tokens = []
+        self._slots = []  # (x, width) of each cell from the last layout
+        self._digit_width = 0
+        self.texture_uploads = 0  # Glyphs rendered since start, for profiling
+        super().__init__(**kwargs)
         with self.canvas:
-            # Draw clock face
-            Color(0.95, 0.95, 0.95, 1)
-            Ellipse(pos=(cx - radius, cy - radius), size=(2*radius, 2*radius))
-            Color(0.2, 0.2, 0.2, 1)
-            Line(circle=(cx, cy, radius), width=2)
-
-            # Draw hour marks
-            for i in range(12):
-                angle = math.radians(i * 30)
-                x1 = cx + (radius - 8) * math.sin(angle)
-                y1 = cy + (radius - 8) * math.cos(angle)
-                x2 = cx + (radius - 20) * math.sin(angle)
-                y2 = cy + (radius - 20) * math.cos(angle)
-                Line(points=[x1, y1, x2, y2], width=2)
-
-            now = self.time
-            hour = now.hour % 12 + now.minute / 60.0
-            minute = now.minute + now.second / 60.0
-            second = now.second
-
-            # Draw hour hand
-            hour_angle = math.radians(90 - (hour * 30))
-            hx = cx + (radius * 0.5) * math.cos(hour_angle)
-            hy = cy + (radius * 0.5) * math.sin(hour_angle)
-            Color(0.1, 0.1, 0.1, 1)
-            Line(points=[cx, cy, hx, hy], width=4)
+            Color(1, 1, 1, 1)
+            self._cell_group = InstructionGroup()
+        self.bind(pos=self._layout, size=self._layout, font_size=self._reset_glyphs)
+        self._set_text()
 
-            # Draw minute hand
-            min_angle = math.radians(90 - (minute * 6))
-            mx = cx + (radius * 0.75) * math.cos(min_angle)
-            my = cy + (radius * 0.75) * math.sin(min_angle)
-            Color(0.2, 0.2, 0.2, 1)
-            Line(points=[cx, cy, mx, my], width=3)
+    def on_text(self, instance, value):
+        self._set_text()
 
-            # Draw second hand
-            sec_angle = math.radians(90 - (second * 6))
-            sx = cx + (radius * 0.85) * math.cos(sec_angle)
-            sy = cy + (radius * 0.85) * math.sin(sec_angle)
-            Color(1, 0, 0, 1)
-            Line(points=[cx, cy, sx, sy], width=1.5)
+    def _glyph(self, token):
+        texture = self._glyphs.get(token)
+        if texture is None:
+            label = CoreLabel(text=token, font_size=self.font_size)
+            label.refresh()
+            texture = label.texture
+            self._glyphs[token] = texture
+            self.texture_uploads += 1
+        return texture
+
+    def _reset_glyphs(self, *args):
+        self._glyphs = {}
+        self._tokens = []
+        self._digit_width = 0
+        self._set_text()
+
+    def _cell_width(self, token):
+        if token.isdigit():
+            if not self._digit_width:
+                self._digit_width = max(self._glyph(d).width for d in '0123456789')
+            return self._digit_width
+        return self._glyph(token).width
+
+    def _set_text(self):
+        if not hasattr(self, '_cell_group'):
+            return
+        tokens = re.findall(r'[AP]M|.', self.text)
+        if len(tokens) != len(self._tokens):
+            # Different shape of string: rebuild the cells
+            self._cell_group.clear()
+            self._cells = [Rectangle(size=(0, 0)) for _ in tokens]
+            for cell in self._cells:
+                self._cell_group.add(cell)
+            self._tokens = [None] * len(tokens)
+
+        relayout = len(self._slots) != len(tokens)
+        for i, token in enumerate(tokens):
+            if token == self._tokens[i]:
+                continue
+            self._cells[i].texture = self._glyph(token)
+            self._tokens[i] = token
+            if relayout or self._cell_width(token) != self._slots[i][1]:
+                relayout = True
+            else:
+                self._place(i)
+        if relayout:
+            self._layout()
+
+    def _place(self, i):
+        """Center cell i's glyph within its slot"""
+        x, width = self._slots[i]
+        glyph = self._cells[i].texture
+        self._cells[i].size = glyph.size
+        self._cells[i].pos = (x + (width - glyph.width) / 2, self.center_y - glyph.height / 2)
+
+    def _layout(self, *args):
+        """Place cells centered in the widget; digits share one width so they don't jiggle"""
+        if not self._cells:
+            return
+        widths = [self._cell_width(token) for token in self._tokens]
+
+        x = self.center_x - sum(widths) / 2
+        self._slots = []
+        for width in widths:
+            self._slots.append((x, width))
+            x += width
+        for i in range(len(self._cells)):
+            self._place(i)
 
-            # Draw center dot
-            Color(0, 0, 0, 1)
-            Ellipse(pos=(cx - 5, cy - 5), size=(10, 10))
 
 class ClockWidget:
+    def __init__(self, smooth_sweep=False, sweep_fps=10, jitter_log_interval=60):
+        self.smooth_sweep = smooth_sweep
+        self.sweep_fps = sweep_fps
+        self.jitter_log_interval = jitter_log_interval  # Ticks between jitter reports (0 = off)
+
+        self._tick_event = None
+        self._sweep_event = None
+        self._target = 0  # Wall-clock second the pending tick is aiming for
+        self._lead = 0.0  # How early to arm, learned from observed scheduling latency
+        self._jitter = []
+        self._uploads_logged = 0
+
     def render(self, parent):
         self.layout = BoxLayout(orientation='vertical', spacing=10)
         self.analog = AnalogClockFace(size_hint=(1, 0.7))
-        self.label = Label(text=self.get_time(), font_size='40sp', size_hint=(1, 0.3))
+        self.analog.smooth = self.smooth_sweep
+        self.label = DigitalClockLabel(text=self.get_time(), font_size='40sp', size_hint=(1, 0.3))
         self.layout.add_widget(self.analog)
         self.layout.add_widget(self.label)
         parent.add_widget(self.layout)
 
-    def update(self):
-        now = datetime.now()
+    def start(self):
+        """Start ticking on wall-clock second boundaries (and sweeping, if enabled)"""
+        self.stop()
+        self._arm(time.time())
+        if self.smooth_sweep:
+            self._sweep_event = Clock.schedule_interval(self._sweep, 1.0 / self.sweep_fps)
+
+    def stop(self):
+        for event in (self._tick_event, self._sweep_event):
+            if event is not None:
+                event.cancel()
+        self._tick_event = None
+        self._sweep_event = None
+
+    def _arm(self, now):
+        """Schedule the next tick for the next whole second"""
+        self._target = math.floor(now) + 1
+        delay = self._target - time.time() - self._lead
+        self._tick_event = Clock.schedule_once(self._tick, max(0, delay))
+
+    def _tick(self, dt):
+        now = time.time()
+        jitter = now - self._target
+        self._record_jitter(jitter)
+
+        # Learn the typical lateness so the next tick is armed that much earlier
+        self._lead = max(0.0, min(0.1, self._lead + 0.2 * jitter))
+
+        # If we woke slightly early, we're still showing the second we aimed for
+        shown = max(now, self._target)
+        self.update(datetime.fromtimestamp(shown))
+        self._arm(shown)
+
+    def _sweep(self, dt):
+        # Only the hands move between second ticks; the label is left alone
+        self.analog.set_time(datetime.now())
+
+    def _record_jitter(self, jitter):
+        if not self.jitter_log_interval:
+            return
+        self._jitter.append(jitter)
+        if len(self._jitter) >= self.jitter_log_interval:
+            samples = [abs(j) * 1000 for j in self._jitter]
+            uploads = self.label.texture_uploads - self._uploads_logged
+            self._uploads_logged = self.label.texture_uploads
+            print(f"[Clock] Tick jitter over {len(samples)} ticks: "
+                  f"mean {sum(samples) / len(samples):.1f} ms, max {max(samples):.1f} ms, "
+                  f"arm lead {self._lead * 1000:.1f} ms, glyph texture uploads {uploads}")
+            self._jitter = []
+
+    def update(self, now=None):
+        if now is None:
+            now = datetime.now()
         self.label.text = now.strftime('%I:%M:%S %p')
         self.analog.set_time(now)
 
     def get_time(self):
-        return datetime.now().strftime('%I:%M:%S %p')
\ No newline at end of file
+        return datetime.now().strftime('%I:%M:%S %p')
@@ -11,7 +11,7 @@ class ColoredBox(BoxLayout):
         self.padding = 5
 
         with self.canvas.before:
-            Color(*color)
+            self.bg_color = Color(*color)
             self.rect = Rectangle(pos=self.pos, size=self.size)
 
         self.bind(pos=self._update_rect, size=self._update_rect)
@@ -20,3 +20,7 @@ class ColoredBox(BoxLayout):
     def _update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
+
+    def set_color(self, color):
+        """Recolor the background in place"""
+        self.bg_color.rgba = color
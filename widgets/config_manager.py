@@ -109,10 +109,7 @@ class ConfigManager:
         grid_container = GridLayout(cols=2, rows=2, spacing=5, size_hint_y=0.8)
         
         # Available widget types
-        widget_types = [
-            "weather", "system_monitor", "quote", "finance", 
-            "news", "calendar", "none"
-        ]
+        widget_types = self.dashboard.widget_registry.widget_types() + ["none"]
         
         # Create dropdown for each grid position
         for position in range(4):
@@ -267,6 +264,9 @@ class ConfigManager:
                 if widget_type == "none":
                     widget["enabled"] = False
                 else:
+                    if widget["type"] != widget_type:
+                        # Options (location, symbol, ...) belong to the old widget type
+                        widget.pop("options", None)
                     widget["type"] = widget_type
                     widget["enabled"] = True
                 return
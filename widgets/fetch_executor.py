@@ -0,0 +1,131 @@
+# widgets/fetch_executor.py
+
+from concurrent.futures import ThreadPoolExecutor
+from kivy.clock import Clock
+
+
+class FetchTask:
+    """Handle for a single unit of background work submitted by a widget"""
+
+    def __init__(self, owner, on_success, on_error, timeout):
+        self.owner = owner
+        self.on_success = on_success
+        self.on_error = on_error
+        self.timeout = timeout
+        self.future = None
+        self.timeout_event = None
+        self.finished = False  # Set on the UI thread once a callback has fired (or never will)
+        self.expired = False  # Timed out, but the worker thread may still be running it
+
+
+class FetchExecutor:
+    """Bounded thread pool for network I/O.
+
+    Work runs on a worker thread; success/error callbacks are always delivered
+    on the Kivy main thread via Clock.schedule_once, so callbacks may touch widgets.
+    """
+
+    def __init__(self, max_workers=3, default_timeout=20):
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self._pool = None
+        self._tasks = {}  # id(owner) -> list of in-flight FetchTask
+
+    def _get_pool(self):
+        # Create threads lazily so importing a widget never spawns workers
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='fetch')
+        return self._pool
+
+    def submit(self, owner, fn, on_success=None, on_error=None, timeout=None):
+        """Run fn() in the background and deliver its result to on_success/on_error.
+
+        If the task has not completed after `timeout` seconds, on_error receives a
+        TimeoutError and any late result is discarded. A worker thread cannot be
+        interrupted, so fetch functions should still pass their own socket timeouts;
+        until a timed-out call really returns, its owner stays busy, so a hung
+        upstream holds at most one worker per owner.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        task = FetchTask(owner, on_success, on_error, timeout)
+        self._tasks.setdefault(id(owner), []).append(task)
+
+        task.future = self._get_pool().submit(fn)
+        if timeout:
+            task.timeout_event = Clock.schedule_once(lambda dt: self._expire(task), timeout)
+
+        # add_done_callback runs on the worker thread; hop back to the UI thread
+        task.future.add_done_callback(
+            lambda future: Clock.schedule_once(lambda dt: self._complete(task), 0)
+        )
+        return task
+
+    def _complete(self, task):
+        """Deliver a finished future's result (UI thread)"""
+        if task.expired:
+            # The timed-out call has finally returned; the owner may submit again
+            self._forget(task)
+        if task.finished:
+            return
+        self._finish(task)
+
+        error = task.future.exception()
+        if error is not None:
+            if task.on_error:
+                task.on_error(error)
+        elif task.on_success:
+            task.on_success(task.future.result())
+
+    def _expire(self, task):
+        """Fail a task that ran past its timeout (UI thread)"""
+        if task.finished:
+            return
+        if task.future.cancel():
+            self._finish(task)
+        else:
+            # Still running: drop its result, but keep the owner busy until it returns
+            task.expired = True
+            self._finish(task, forget=False)
+        if task.on_error:
+            task.on_error(TimeoutError(f"fetch timed out after {task.timeout}s"))
+
+    def _finish(self, task, forget=True):
+        task.finished = True
+        if task.timeout_event is not None:
+            task.timeout_event.cancel()
+            task.timeout_event = None
+        if forget:
+            self._forget(task)
+
+    def _forget(self, task):
+        tasks = self._tasks.get(id(task.owner))
+        if tasks and task in tasks:
+            tasks.remove(task)
+            if not tasks:
+                del self._tasks[id(task.owner)]
+
+    def is_busy(self, owner):
+        """True if owner already has work in flight"""
+        return bool(self._tasks.get(id(owner)))
+
+    def cancel(self, owner):
+        """Cancel all work for owner; callbacks for running tasks are dropped"""
+        for task in list(self._tasks.get(id(owner), [])):
+            self._finish(task)
+            task.future.cancel()
+
+    def shutdown(self):
+        """Stop accepting work and drop anything still queued"""
+        for tasks in list(self._tasks.values()):
+            for task in list(tasks):
+                self._finish(task)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Shared executor used by all widgets
+fetch_executor = FetchExecutor()
@@ -1,31 +1,382 @@
 # widgets/financewidget.py
 
 import yfinance as yf
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter
 from kivy.uix.boxlayout import BoxLayout
-from kivy_garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
+from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import io
-from kivy.core.image import Image as CoreImage
-from kivy.uix.image import Image
+from datetime import datetime, timezone
+import importlib
+import math
 import numpy as np
+import pandas as pd
 import time
+from widgets.indicators import IndicatorSet
+from widgets.price_series import BAR_FIELDS, PriceBuffer
+from widgets.market_hours import REGULAR, market_calendar
+from widgets.performance_config import load_performance_config
+from widgets.price_store import price_store
+from widgets.providers import DataProvider, providers
+from widgets.quote_stream import streams
+from widgets.snapshot import format_age
 
+HISTORY_SECONDS = 7 * 86400  # Span of history kept in memory and pushed to widgets
+BAR_INTERVAL = '1h'
+BAR_SECONDS = 3600
+BACKFILL_SLACK = 4 * 86400  # Weekends and holidays mean history never starts exactly on time
+EMPTY_BARS = (np.array([]), {})
 
-class FinanceWidget(BoxLayout):
-    def __init__(self, symbol="QQQ", **kwargs):
+# chart "range" option -> (days, title label)
+CHART_RANGES = {
+    '7d': (7, '7-Day'),
+    '1mo': (31, '1-Month'),
+    '3mo': (92, '3-Month'),
+    '1y': (365, '1-Year'),
+}
+
+# Symbols shown by a watchlist widget without a "symbols" option
+DEFAULT_WATCHLIST = ['SPY', 'QQQ', 'DIA', 'IWM', 'AAPL', 'MSFT', 'NVDA', 'AMZN']
+
+
+class YFinanceProvider(DataProvider):
+    """Hourly price bars for every watched symbol, fetched in one batched download.
+
+    Widgets register the symbols they show with watch(). A fetch downloads all of
+    them with a single yf.download call and splits the columns into one
+    PriceBuffer per symbol, so every finance widget shares one upstream call per
+    interval. After a symbol's first full download only bars from its newest held
+    one onward are requested and merged in.
+
+    Every download is also written to the on-disk price store, which survives
+    restarts and holds the longer ranges some charts show. Each symbol's range is
+    the longest any widget watching it charts, so only charted symbols are ever
+    backfilled; full downloads are batched per range. The in-memory buffers
+    only keep the last week.
+
+    Widgets that stream() symbols also get live trades from the WebSocket quote
+    feed, folded into each symbol's forming bar between polls.
+    """
+
+    source = 'yahoo'
+
+    def __init__(self, *params):
+        super().__init__(*params)
+        self.watchers = {}  # id(owner) -> symbols that owner shows
+        self.spans = {}  # id(owner) -> seconds of history that owner charts
+        self.symbol_spans = {}  # symbol -> longest history any owner watching it charts
+        self.buffers = {}  # symbol -> PriceBuffer
+        # Configured here rather than in main.py so numpy stays out of boot
+        # when no finance widget is shown
+        self.store = price_store
+        performance_config = load_performance_config()
+        self.store.configure(**performance_config['price_store'])
+        market_calendar.configure(**performance_config['market_hours'])
+        self.streaming = performance_config['streaming']
+        self.quote_stream = None
+        self.streamers = {}  # id(owner) -> symbols that owner wants live
+        self._backfilled = {}  # symbol -> span already downloaded in full this session
+        self.full_fetches = 0
+        self.incremental_fetches = 0
+
+    @property
+    def symbols(self):
+        return sorted(set().union(*self.watchers.values()))
+
+    def watch(self, owner, symbols, on_data, on_error=None, history=HISTORY_SECONDS):
+        """Subscribe owner to the bars of `symbols`, keeping `history` seconds on disk"""
+        self.watchers[id(owner)] = tuple(symbols)
+        self.spans[id(owner)] = max(history, HISTORY_SECONDS)
+        self._update_spans()
+        self.subscribe(owner, on_data, on_error)
+
+    def _update_spans(self):
+        spans = {}
+        for key, symbols in self.watchers.items():
+            for symbol in symbols:
+                spans[symbol] = max(spans.get(symbol, HISTORY_SECONDS), self.spans[key])
+        self.symbol_spans = spans
+
+    def stream(self, owner, symbols):
+        """Fold live trades for `symbols` into their forming bars between polls"""
+        self.streamers[id(owner)] = tuple(symbols)
+        if self.quote_stream is None:
+            self.quote_stream = streams.get(self.streaming['url'], ui_rate=self.streaming['ui_rate'])
+        self.quote_stream.subscribe(self, self._streamed_symbols(), self._on_ticks)
+
+    @property
+    def streaming_live(self):
+        return self.quote_stream is not None and self.quote_stream.connected
+
+    def _streamed_symbols(self):
+        return sorted(set().union(*self.streamers.values()))
+
+    def unsubscribe(self, owner):
+        self.watchers.pop(id(owner), None)
+        self.spans.pop(id(owner), None)
+        self._update_spans()
+        if self.streamers.pop(id(owner), None) is not None:
+            if self.streamers:
+                self.quote_stream.subscribe(self, self._streamed_symbols(), self._on_ticks)
+            else:
+                streams.release(self.quote_stream, self)
+                self.quote_stream = None
+        super().unsubscribe(owner)
+        watched = set(self.symbols)
+        for symbol in list(self.buffers):
+            if symbol not in watched:
+                del self.buffers[symbol]
+
+    def is_fresh(self, max_age):
+        # A newly watched symbol isn't in the last batch yet
+        return super().is_fresh(max_age) and all(s in self.data for s in self.symbols)
+
+    def fetch_args(self):
+        """Newest bar and history span per watched symbol, plus backfill state (UI thread)"""
+        held = {}
+        for symbol in self.symbols:
+            buffer = self.buffers.get(symbol)
+            held[symbol] = buffer.last_time if buffer else None
+        return held, dict(self.symbol_spans), dict(self._backfilled)
+
+    def fetch(self, held, spans, backfilled):
+        """Download new bars for the symbols in `held` (runs on a worker thread).
+
+        held maps each symbol to the newest bar in memory (None if there is none),
+        spans to the seconds of history its widgets chart, and backfilled to the
+        span already downloaded in full this session.
+        Returns {'bars': {symbol: (full, times, columns)}, 'backfilled': {symbol: span},
+        'full_fetches': count, 'incremental_fetches': count}.
+        """
+        now = time.time()
+        full, incremental = [], []
+        for symbol, last_time in held.items():
+            wanted = spans[symbol]
+            stored = self.store.span(symbol, BAR_INTERVAL)
+            if stored is not None:
+                # After a restart the store knows where we left off
+                last_time = max(last_time or 0, stored[1])
+
+            # A long-range chart needs older history than the store holds
+            backfill = (self.store.enabled and wanted > HISTORY_SECONDS
+                        and backfilled.get(symbol, 0) < wanted
+                        and (stored is None or stored[0] > now - wanted + BACKFILL_SLACK))
+            if last_time is None or now - last_time > wanted or backfill:
+                full.append(symbol)
+            else:
+                incremental.append((symbol, last_time))
+
+        results = {}
+        if incremental:
+            # Start at the oldest "newest bar" we hold: it may still have been forming
+            start = min(last_time for _, last_time in incremental)
+            bars = self._download([symbol for symbol, _ in incremental],
+                                  start=datetime.fromtimestamp(start, tz=timezone.utc))
+            for symbol, last_time in incremental:
+                times, columns = bars.get(symbol, EMPTY_BARS)
+                if len(times) and times[0] > last_time:
+                    # Reply doesn't overlap what we hold, so bars may be missing: start over
+                    full.append(symbol)
+                else:
+                    results[symbol] = (False, times, columns)
+
+        # One download per distinct range, so a year-long chart doesn't drag
+        # every watchlist symbol along with it
+        periods = {}
+        for symbol in full:
+            periods.setdefault(math.ceil(spans[symbol] / 86400), []).append(symbol)
+        for days, symbols in sorted(periods.items()):
+            bars = self._download(symbols, period=f"{days}d")
+            for symbol in symbols:
+                results[symbol] = (True,) + bars.get(symbol, EMPTY_BARS)
+
+        for symbol, (full_fetch, times, columns) in list(results.items()):
+            self.store.merge(symbol, BAR_INTERVAL, times, columns)
+            if full_fetch or held[symbol] is None:
+                # Fill the in-memory week from disk rather than from this reply alone
+                stored = self.store.span(symbol, BAR_INTERVAL)
+                if stored is not None:
+                    series = self.store.read(symbol, BAR_INTERVAL, since=stored[1] - HISTORY_SECONDS)
+                    results[symbol] = (True, series['time'], series)
+        return {
+            'bars': results,
+            'backfilled': {symbol: spans[symbol] for symbol in full},
+            'full_fetches': len(periods),
+            'incremental_fetches': int(bool(incremental)),
+        }
+
+    @staticmethod
+    def _download(symbols, **kwargs):
+        """One yf.download for all symbols, split into {symbol: (times, columns)}"""
+        # Download stock data with explicit auto_adjust parameter
+        frame = yf.download(symbols, interval="1h", group_by='ticker', progress=False,
+                            auto_adjust=True, prepost=market_calendar.extended_hours, **kwargs)
+        if frame is None or frame.empty:
+            return {}
+        all_times = np.array([ts.timestamp() for ts in frame.index])
+        grouped = isinstance(frame.columns, pd.MultiIndex)
+        tickers = set(frame.columns.get_level_values(0)) if grouped else set(symbols)
+
+        bars = {}
+        for symbol in symbols:
+            if symbol not in tickers:
+                continue
+            sub = frame[symbol] if grouped else frame
+            if 'Close' not in sub:
+                continue
+            # Symbols trading on other calendars have NaN rows in the shared index
+            close = np.asarray(sub['Close'], dtype=float).ravel()
+            keep = ~np.isnan(close)
+            columns = {}
+            for name in BAR_FIELDS:
+                label = name.capitalize()
+                if label in sub:
+                    columns[name] = np.asarray(sub[label], dtype=float).ravel()[keep]
+            bars[symbol] = (all_times[keep], columns)
+        return bars
+
+    def history(self, symbol, since):
+        """Bars from `since` on, read from disk (falls back to the in-memory week)"""
+        series = self.store.read(symbol, BAR_INTERVAL, since=since)
+        if series is None:
+            buffer = self.buffers.get(symbol)
+            if buffer is None or not len(buffer):
+                return None
+            series = buffer.series(since)
+        return series
+
+    def seed(self, symbol, series):
+        """Prime an empty buffer with bars from a snapshot so the next fetch is incremental"""
+        buffer = self.buffers.setdefault(symbol, PriceBuffer())
+        if not len(buffer):
+            buffer.merge(series['time'], series)
+
+    def _on_success(self, results):
+        self._backfilled.update(results['backfilled'])
+        self.full_fetches += results['full_fetches']
+        self.incremental_fetches += results['incremental_fetches']
+
+        watched = set(self.symbols)
+        for symbol, (full, times, columns) in results['bars'].items():
+            if symbol not in watched:
+                continue
+            buffer = self.buffers.setdefault(symbol, PriceBuffer())
+            if full and len(times):
+                buffer.clear()
+            buffer.merge(times, columns)
+
+        data = {}
+        for symbol, buffer in self.buffers.items():
+            if len(buffer):
+                data[symbol] = buffer.series(buffer.last_time - HISTORY_SECONDS)
+        super()._on_success(data)
+
+    def _on_ticks(self, ticks):
+        """Fold streamed trades into each symbol's forming bar and push the change (UI thread)"""
+        changed = {}
+        for symbol, (tick_time, price, size) in ticks.items():
+            buffer = self.buffers.get(symbol)
+            if buffer is None or not len(buffer):
+                continue  # Live prices only make sense on top of polled history
+            last_time = buffer.last_time
+            bar_time = last_time + math.floor((tick_time - last_time) / BAR_SECONDS) * BAR_SECONDS
+            if bar_time < last_time:
+                continue
+
+            # Same bar: extend it; later bar: start a new one at this price
+            bar = buffer.last_bar() if bar_time == last_time else None
+            if bar is None:
+                bar = {'open': price, 'high': price, 'low': price, 'volume': 0.0}
+            buffer.merge([bar_time], {
+                'open': [bar['open']],
+                'high': [np.fmax(bar['high'], price)],
+                'low': [np.fmin(bar['low'], price)],
+                'close': [price],
+                'volume': [np.nan_to_num(bar['volume']) + size],
+            })
+            changed[symbol] = buffer.series(buffer.last_time - HISTORY_SECONDS)
+
+        if changed:
+            # The next poll overwrites the forming bar with Yahoo's own values
+            self.data = {**(self.data or {}), **changed}
+            for on_data, _ in list(self.subscribers.values()):
+                on_data(changed)
+
+
+def daily_change(series):
+    """(latest price, % change from the previous session's last close)"""
+    times, close = series['time'], series['close']
+    latest = float(close[-1])
+    # Sessions are dated in the exchange's timezone, not the dashboard's
+    tz = market_calendar.tz
+    today = datetime.fromtimestamp(times[-1], tz).date()
+    base = float(close[0])
+    for i in range(len(times) - 2, -1, -1):
+        if datetime.fromtimestamp(times[i], tz).date() < today:
+            base = float(close[i])
+            break
+    change = (latest - base) / base * 100 if base else 0.0
+    return latest, change
+
+
+# chart option -> (module, class name). Imported on first use, so matplotlib is
+# only loaded when some widget actually asks for it.
+CHART_BACKENDS = {
+    'matplotlib': ('widgets.finance_chart', 'MatplotlibChart'),
+    'sparkline': ('widgets.sparkline', 'SparklineChart'),
+}
+
+
+def load_chart_class(chart):
+    """Import and return the chart class for a `chart` option"""
+    if chart not in CHART_BACKENDS:
+        print(f"[FinanceWidget] Unknown chart '{chart}', using matplotlib")
+        chart = 'matplotlib'
+    module_name, class_name = CHART_BACKENDS[chart]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class MarketHoursMixin:
+    """Scheduler hook for widgets polling YFinanceProvider (needs update_interval and provider)"""
+
+    def next_update_in(self):
+        """Seconds until the scheduler should update this widget again"""
+        session = market_calendar.session()
+        delay = market_calendar.next_poll_delay(self.update_interval)
+        if self.provider.streaming_live:
+            # The stream keeps the price current; polls only refresh the bars
+            delay = max(delay, self.provider.streaming['poll_interval'])
+        if delay > self.update_interval and session != REGULAR:
+            print(f"[{type(self).__name__}] Market {session}, next update in {format_age(delay)}")
+        return delay
+
+
+class FinanceWidget(MarketHoursMixin, BoxLayout):
+    def __init__(self, symbol="QQQ", chart="matplotlib", range="7d", stream=False,
+                 indicators=None, theme="light", **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.symbol = symbol
+        if range not in CHART_RANGES:
+            print(f"[FinanceWidget] Unknown range '{range}', using 7d")
+            range = '7d'
+        days, range_label = CHART_RANGES[range]
+        self.history = days * 86400  # Seconds of history on the chart
         self.label = Label(text=f"{self.symbol} — Loading...", font_size="12sp")
         self.add_widget(self.label)
+
+        # Optional overlays and stats, e.g. {"sma": [20], "ema": [12], "vwap": true,
+        # "day_range": true, "changes": ["1d", "5d"]}
+        self.indicators = IndicatorSet(**indicators) if indicators else None
+        self.stats_label = None
+        if self.indicators and (self.indicators.day_range or self.indicators.changes):
+            self.stats_label = Label(text="", font_size="10sp", markup=True,
+                                     size_hint_y=None, height=18)
+            self.add_widget(self.stats_label)
         
-        # Create image widget for chart
-        self.chart_image = Image(size_hint=(1, 0.7))
-        self.add_widget(self.chart_image)
+        # Chart backend is chosen per widget with the "chart" option
+        chart_class = load_chart_class(chart)
+        self.chart = chart_class(title=f'{self.symbol} {range_label}', theme=theme,
+                                 size_hint=(1, 0.7))
+        self.add_widget(self.chart)
         
         # Cache for finance data
         self.last_update = 0
@@ -33,13 +384,29 @@ class FinanceWidget(BoxLayout):
         self.cached_chart = None
         self.update_interval = 120  # 2 minutes
         self.first_update = True  # Flag for first update
-        self.last_chart_update = 0  # Track chart updates separately
+        self.stale = False  # True while showing data restored from a snapshot
+
+        # All finance widgets share one provider (and one batched download)
+        self.provider = providers.get(YFinanceProvider)
+        self.provider.watch(self, [symbol], self._apply_data, self._on_fetch_error,
+                            history=self.history)
+        self.stream = stream
+        self.last_chart_update = 0
+        if stream:
+            # Live trades from the quote feed update the price between polls
+            self.provider.stream(self, [symbol])
+
+    def release(self):
+        """Stop receiving data when the widget is removed from the dashboard"""
+        providers.release(self.provider, self)
+        if hasattr(self.chart, 'release'):
+            self.chart.release()
 
     def render(self, parent):
         parent.add_widget(self)
         self.update()
 
-    def update(self):
+    def update(self, force=False):
         current_time = time.time()
         
         # Skip cache check on first update or if forced
@@ -48,110 +415,225 @@ class FinanceWidget(BoxLayout):
             self.last_update = 0  # Force update
         
         # Only update if enough time has passed
-        if current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
+        if not force and current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
             return
             
-        try:
-            # Download stock data with explicit auto_adjust parameter
-            data = yf.download(self.symbol, period="7d", interval="1h", progress=False, auto_adjust=True)
-            
-            if data.empty:
+        # Reuse history another widget downloaded within the last half interval
+        self.provider.request(self, max_age=self.update_interval / 2)
+
+    def _apply_data(self, quotes):
+        """Show the latest bars and refresh the chart (UI thread)"""
+        current_time = time.time()
+
+        series = quotes.get(self.symbol)
+        if series is None:
+            return  # Streamed update for other symbols
+        if not len(series['close']):
+            if not self.cached_data:
                 self.label.text = f"{self.symbol} — No data"
-                return
-            
-            # Get latest price using iloc[-1] to avoid deprecation warning
-            latest_price = float(data['Close'].iloc[-1])
-            self.label.text = f"{self.symbol} — ${latest_price:.2f}"
-            
-            # Cache the data
-            self.cached_data = {
-                'price': latest_price,
-                'data': data
-            }
-            self.last_update = current_time
-            
-            # Create chart on first update or every 5 minutes
-            if self.first_update or current_time - self.last_chart_update > 300:
-                self._create_chart(data)
-                self.last_chart_update = current_time
-            
-            print(f"[FinanceWidget] Updated {self.symbol} with {len(data)} points")
-            
-        except Exception as e:
-            print(f"Finance update failed: {e}")
-            # Use cached data if available
-            if self.cached_data:
-                self.label.text = f"{self.symbol} — ${self.cached_data['price']:.2f}"
-            else:
-                self.label.text = f"{self.symbol} — Error"
+            return
+        close = series['close']
+
+        latest_price = float(close[-1])
+        self.label.text = f"{self.symbol} — ${latest_price:.2f}"
 
-    def _create_chart(self, data):
-        """Create a simple price chart"""
+        # Cache the data
+        self.cached_data = {
+            'price': latest_price,
+            'series': series
+        }
+        self.last_update = current_time
+        self.stale = False
+
+        # Redraws only if the series actually changed; live ticks redraw at most once a second
+        if not self.stream or current_time - self.last_chart_update >= 1.0:
+            self._update_chart(series)
+            self.last_chart_update = current_time
+
+        if not self.stream:
+            print(f"[FinanceWidget] Updated {self.symbol} with {len(close)} points")
+
+    def _on_fetch_error(self, e):
+        print(f"Finance update failed: {e}")
+        # Use cached data if available, marked with its age
+        if self.cached_data:
+            self.label.text = (f"{self.symbol} — ${self.cached_data['price']:.2f}"
+                               f" (cached {format_age(time.time() - self.last_update)} ago)")
+        else:
+            self.label.text = f"{self.symbol} — Error"
+
+    def get_snapshot(self):
+        """Last good price series for the warm-start snapshot"""
+        if not self.cached_data:
+            return None
+        series = self.cached_data['series']
+        snapshot = {
+            'symbol': self.symbol,
+            'price': self.cached_data['price'],
+            'times': series['time'].tolist()
+        }
+        for name in BAR_FIELDS:
+            snapshot[name] = series[name].tolist()
+        return snapshot
+
+    def restore_snapshot(self, data, fetched_at):
+        """Paint a saved price series until fresh data arrives"""
+        if data.get('symbol') != self.symbol:
+            return
+        times = np.array(data['times'], dtype=float)
+        series = {'time': times}
+        for name in BAR_FIELDS:
+            # Older snapshots only stored closing prices
+            series[name] = np.array(data.get(name, [np.nan] * len(times)), dtype=float)
+
+        self.cached_data = {
+            'price': data['price'],
+            'series': series
+        }
+        self.last_update = fetched_at
+        self.first_update = False
+        self.stale = True
+        self.provider.seed(self.symbol, series)
+
+        self.label.text = f"{self.symbol} — ${data['price']:.2f} (cached {format_age(time.time() - fetched_at)} ago)"
+        self._update_chart(series)
+
+    def _update_chart(self, series):
+        """Hand the latest series to the chart, which redraws only if it changed"""
         try:
-            # Close any existing figures to prevent memory issues
-            plt.close('all')
-            
-            # Set style for cleaner look
-            plt.style.use('default')
-            
-            # Create figure with better proportions
-            fig, ax = plt.subplots(figsize=(4, 2.5), dpi=100, facecolor='white')
-            
-            # Ensure price_change is a float
-            close_series = data['Close']
-            first_price = float(close_series.iloc[0])
-            last_price = float(close_series.iloc[-1])
-            price_change = last_price - first_price
-            line_color = 'green' if price_change >= 0 else 'red'
-            
-            # Plot closing prices with better styling
-            ax.plot(data.index, close_series.values, linewidth=2, color=line_color, alpha=0.8)
-            
-            # Add subtle grid
-            ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-            
-            # Format title and labels
-            ax.set_title(f'{self.symbol} 7-Day', fontsize=10, fontweight='bold', pad=10)
-            ax.set_ylabel('Price ($)', fontsize=8, fontweight='bold')
-            
-            # Format axis ticks
-            ax.tick_params(axis='both', which='major', labelsize=7)
-            ax.tick_params(axis='x', rotation=45)
-            
-            # Format y-axis to show currency
-            def currency_formatter(x, pos):
-                return f'${x:.0f}'
-            ax.yaxis.set_major_formatter(FuncFormatter(currency_formatter))
-            
-            # Remove top and right spines for cleaner look
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_alpha(0.7)
-            ax.spines['bottom'].set_alpha(0.7)
-            
-            # Add subtle background color
-            ax.set_facecolor('#f8f9fa')
-            
-            # Tight layout to prevent label cutoff
-            plt.tight_layout(pad=1.0)
-            
-            # Convert to image
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', bbox_inches='tight', dpi=100, 
-                       facecolor='white', edgecolor='none')
-            buf.seek(0)
-            
-            # Create Kivy image
-            image = CoreImage(buf, ext='png')
-            self.chart_image.texture = image.texture
-            
-            # Close figure to free memory
-            plt.close(fig)
-            buf.close()
-            
-            print(f"[FinanceWidget] Chart created for {self.symbol}")
-            
+            if self.history > HISTORY_SECONDS:
+                # Longer ranges come straight from the on-disk store
+                stored = self.provider.history(self.symbol, series['time'][-1] - self.history)
+                if stored is not None:
+                    series = stored
+            overlays = None
+            if self.indicators:
+                # Only bars added or changed since the last update are computed
+                results = self.indicators.update(series)
+                overlays = results['overlays']
+                self._show_stats(results['stats'])
+            if self.chart.set_series(series['time'], series['close'], overlays):
+                print(f"[FinanceWidget] Chart updated for {self.symbol}")
         except Exception as e:
-            print(f"Chart creation failed: {e}")
-            # If chart fails, just show text
-            self.chart_image.source = ""
+            print(f"Chart update failed: {e}")
+
+    def _show_stats(self, stats):
+        """Day range and % changes under the price"""
+        if self.stats_label is None:
+            return
+        parts = []
+        if 'day_range' in stats:
+            low, high = stats['day_range']
+            parts.append(f"Day {low:.2f}–{high:.2f}")
+        for label, change in stats.get('changes', {}).items():
+            color = '33cc55' if change >= 0 else 'e04040'
+            parts.append(f"{label} [color={color}]{change:+.2f}%[/color]")
+        self.stats_label.text = "  ·  ".join(parts)
+
+
+class WatchlistWidget(MarketHoursMixin, BoxLayout):
+    """Price and daily change for many symbols, all from the shared batched download"""
+
+    def __init__(self, symbols=None, stream=False, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.symbols = list(symbols or DEFAULT_WATCHLIST)
+        self.title = Label(text="Watchlist — Loading...", font_size="12sp", size_hint=(1, None), height=24)
+        self.add_widget(self.title)
+
+        # One row per symbol; labels are created once and only their text changes
+        grid = GridLayout(cols=3)
+        self.rows = {}
+        for symbol in self.symbols:
+            price_label = Label(text="—", font_size="11sp")
+            change_label = Label(text="", font_size="11sp", markup=True)
+            grid.add_widget(Label(text=symbol, font_size="11sp", bold=True))
+            grid.add_widget(price_label)
+            grid.add_widget(change_label)
+            self.rows[symbol] = (price_label, change_label)
+        self.add_widget(grid)
+
+        self.last_update = 0
+        self.cached_data = None
+        self.update_interval = 120  # 2 minutes
+        self.first_update = True  # Flag for first update
+        self.stale = False  # True while showing data restored from a snapshot
+
+        self.provider = providers.get(YFinanceProvider)
+        self.provider.watch(self, self.symbols, self._apply_data, self._on_fetch_error)
+        if stream:
+            self.provider.stream(self, self.symbols)
+
+    def release(self):
+        """Stop receiving data when the widget is removed from the dashboard"""
+        providers.release(self.provider, self)
+
+    def render(self, parent):
+        parent.add_widget(self)
+        self.update()
+
+    def update(self, force=False):
+        current_time = time.time()
+
+        if self.first_update:
+            self.first_update = False
+            self.last_update = 0  # Force update
+
+        # Only update if enough time has passed
+        if not force and current_time - self.last_update < self.update_interval and self.cached_data:
+            return
+
+        self.provider.request(self, max_age=self.update_interval / 2)
+
+    def _apply_data(self, quotes):
+        """Show the latest price and change for every symbol in the batch (UI thread)"""
+        rows = {}
+        for symbol in self.symbols:
+            series = quotes.get(symbol)
+            if series is not None and len(series['close']):
+                rows[symbol] = daily_change(series)
+        if not rows:
+            if not self.cached_data:
+                self.title.text = "Watchlist — No data"
+            return
+
+        # Streamed updates only carry the symbols that traded
+        self.cached_data = {**(self.cached_data or {}), **rows}
+        self.last_update = time.time()
+        self.stale = False
+        self.title.text = "Watchlist"
+        self._show_rows(rows)
+
+    def _show_rows(self, rows):
+        for symbol, (price, change) in rows.items():
+            if symbol not in self.rows:
+                continue
+            price_label, change_label = self.rows[symbol]
+            color = '33cc55' if change >= 0 else 'e04040'
+            price_label.text = f"${price:.2f}"
+            change_label.text = f"[color={color}]{change:+.2f}%[/color]"
+
+    def _on_fetch_error(self, e):
+        print(f"Watchlist update failed: {e}")
+        if self.cached_data:
+            self.title.text = f"Watchlist (cached {format_age(time.time() - self.last_update)} ago)"
+        else:
+            self.title.text = "Watchlist — Error"
+
+    def get_snapshot(self):
+        """Last shown prices for the warm-start snapshot"""
+        if not self.cached_data:
+            return None
+        return {symbol: list(row) for symbol, row in self.cached_data.items()}
+
+    def restore_snapshot(self, data, fetched_at):
+        """Show saved prices until fresh data arrives"""
+        rows = {symbol: tuple(row) for symbol, row in data.items() if symbol in self.rows}
+        if not rows:
+            return
+        self.cached_data = rows
+        self.last_update = fetched_at
+        self.first_update = False
+        self.stale = True
+        self.title.text = f"Watchlist (cached {format_age(time.time() - fetched_at)} ago)"
+        self._show_rows(rows)
@@ -0,0 +1,151 @@
+# widgets/finance_chart.py
+
+import hashlib
+import itertools
+from collections import OrderedDict
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
+from kivy.uix.image import Image
+import numpy as np
+from widgets.chart_renderer import chart_renderer
+from widgets.performance_config import load_performance_config
+
+MIN_CHART_SIZE = (120, 80)  # Pixels; smaller tiles (or not yet laid out ones) render at this
+_chart_ids = itertools.count(1)
+
+
+class TextureCache:
+    """Rendered chart textures keyed by (series fingerprint, pixel size, theme).
+
+    Least recently used textures are dropped once their RGBA pixels exceed
+    `max_megabytes`; a chart still showing a dropped texture keeps it alive.
+    """
+
+    def __init__(self, max_megabytes=24, resize_debounce=0.3):
+        self.max_bytes = max_megabytes * 1024 * 1024
+        self.resize_debounce = resize_debounce  # Seconds a size must hold before re-rendering
+        self._textures = OrderedDict()  # key -> Texture
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        texture = self._textures.get(key)
+        if texture is None:
+            self.misses += 1
+            return None
+        self._textures.move_to_end(key)
+        self.hits += 1
+        return texture
+
+    def put(self, key, texture):
+        if key in self._textures:
+            self.bytes -= self._size(self._textures.pop(key))
+        self._textures[key] = texture
+        self.bytes += self._size(texture)
+        while self.bytes > self.max_bytes and len(self._textures) > 1:
+            _, evicted = self._textures.popitem(last=False)
+            self.bytes -= self._size(evicted)
+
+    @staticmethod
+    def _size(texture):
+        width, height = texture.size
+        return width * height * 4
+
+
+# Rendered frames shared by every matplotlib chart
+chart_cache = TextureCache(**load_performance_config()['chart_cache'])
+
+
+class MatplotlibChart(Image):
+    """Full price chart (title, axes, grid) rendered with matplotlib's Agg backend.
+
+    Rendering happens in the chart render process (see widgets/chart_renderer.py),
+    which keeps the Figure and lines alive between renders. This side renders at
+    the widget's real pixel size, reuses cached textures for inputs it has seen
+    before, and only blits finished frames, so matplotlib never runs on the UI
+    thread. Resizes re-render once the size has settled.
+    """
+
+    def __init__(self, title='', theme='light', **kwargs):
+        super().__init__(**kwargs)
+        self.title = title
+        self.theme = theme
+        self.chart_id = next(_chart_ids)
+        self.series = None  # (times, close, overlays) last handed to set_series
+        self.fingerprint = None  # Hash of the series, title and overlays
+        self.chart_key = None  # Cache key of the texture shown
+        self.wanted_key = None  # Cache key of the latest inputs, shown once rendered
+
+        self._resize_event = Clock.create_trigger(self._render, chart_cache.resize_debounce)
+        self.bind(size=self._on_resize)
+
+    def set_series(self, times, close, overlays=None):
+        """Show new data (and indicator overlays), rendering only if it changed"""
+        if len(close) == 0:
+            return False
+
+        overlays = overlays or {}
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.title.encode())
+        digest.update(np.ascontiguousarray(times, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(close, dtype=float).tobytes())
+        for name, values in overlays.items():
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(values, dtype=float).tobytes())
+        fingerprint = digest.hexdigest()
+        if fingerprint == self.fingerprint:
+            return False
+
+        # Copies: the series and indicator arrays are updated in place later
+        self.series = (np.array(times, dtype=float), np.array(close, dtype=float),
+                       {name: np.array(values, dtype=float) for name, values in overlays.items()})
+        self.fingerprint = fingerprint
+        self._render()
+        return True
+
+    def release(self):
+        """Free the chart's frame and figure in the render process"""
+        self._resize_event.cancel()
+        chart_renderer.release(self.chart_id)
+
+    def _pixel_size(self):
+        return (max(MIN_CHART_SIZE[0], int(self.width)), max(MIN_CHART_SIZE[1], int(self.height)))
+
+    def _on_resize(self, *args):
+        # Restart the countdown on every size change; render once it settles
+        self._resize_event.cancel()
+        self._resize_event()
+
+    def _render(self, *args):
+        """Show the cached texture for the current inputs, or render it"""
+        if self.series is None:
+            return
+        key = (self.fingerprint, self._pixel_size(), self.theme)
+        self.wanted_key = key
+        if key == self.chart_key:
+            return
+
+        texture = chart_cache.get(key)
+        if texture is not None:
+            self._show(key, texture)
+            return
+        times, close, overlays = self.series
+        chart_renderer.render(self.chart_id, self.title, self.theme, times, close, overlays,
+                              key[1], lambda pixels, size: self._on_frame(key, pixels, size))
+
+    def _on_frame(self, key, pixels, size):
+        """Blit a rendered RGBA frame into a new cached texture (UI thread)"""
+        texture = Texture.create(size=size, colorfmt='rgba')
+        # Agg rows run top-down, GL textures bottom-up
+        texture.flip_vertical()
+        texture.blit_buffer(pixels, colorfmt='rgba', bufferfmt='ubyte')
+        chart_cache.put(key, texture)
+        if key == self.wanted_key:
+            self._show(key, texture)
+
+    def _show(self, key, texture):
+        # Only a frame on screen counts: a render that failed is retried next time
+        self.chart_key = key
+        self.texture = texture
+        self.canvas.ask_update()
@@ -0,0 +1,140 @@
+# widgets/forecast_strip.py
+
+from datetime import datetime, timezone
+from kivy.graphics import Color, Line, Mesh
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+import numpy as np
+
+HOURS_SHOWN = 24
+DAYS_SHOWN = 7
+MIN_PRECIP_SCALE = 2.0  # mm/h drawn at full height, so drizzle stays small
+
+
+def celsius_to_fahrenheit(values):
+    return values * 9 / 5 + 32
+
+
+def bar_mesh(x0, x1, y0, y1):
+    """Vertices and indices for one quad per bar (Mesh mode 'triangles')"""
+    count = len(x0)
+    vertices = np.zeros((count, 4, 4))  # x, y, u, v per corner
+    vertices[:, 0, 0], vertices[:, 0, 1] = x0, y0
+    vertices[:, 1, 0], vertices[:, 1, 1] = x1, y0
+    vertices[:, 2, 0], vertices[:, 2, 1] = x1, y1
+    vertices[:, 3, 0], vertices[:, 3, 1] = x0, y1
+    indices = (np.arange(count)[:, None] * 4 + (0, 1, 2, 0, 2, 3)).ravel()
+    return vertices.ravel().tolist(), indices.tolist()
+
+
+class ForecastStrip(BoxLayout):
+    """Next 24 hours (temperature line over precipitation bars) and 7-day highs/lows.
+
+    Drawn with Kivy graphics from the NumPy arrays the provider hands over,
+    which are views onto Open-Meteo's FlatBuffers response: only the slices
+    shown are ever converted, and only to build vertex lists.
+    """
+
+    HOURLY_COLOR = (1.0, 0.7, 0.3)
+    PRECIP_COLOR = (0.3, 0.6, 1.0)
+    DAILY_COLOR = (1.0, 0.55, 0.35)
+
+    def __init__(self, padding=4, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.pad = padding
+        self.temps = None  # Next 24 h, °F
+        self.precip = None  # Next 24 h, mm
+        self.highs = None  # Next 7 days, °F
+        self.lows = None
+
+        self.hourly = Widget()
+        with self.hourly.canvas:
+            Color(*self.PRECIP_COLOR, 0.5)
+            self.precip_bars = Mesh(mode='triangles')
+            Color(*self.HOURLY_COLOR, 1)
+            self.temp_line = Line(width=1.2)
+        self.add_widget(self.hourly)
+
+        self.daily = Widget()
+        with self.daily.canvas:
+            Color(*self.DAILY_COLOR, 0.8)
+            self.range_bars = Mesh(mode='triangles')
+        self.add_widget(self.daily)
+
+        self.day_labels = [Label(text="", font_size='9sp', halign='center')
+                           for _ in range(DAYS_SHOWN)]
+        label_row = GridLayout(cols=DAYS_SHOWN, size_hint_y=None, height=28)
+        for label in self.day_labels:
+            label_row.add_widget(label)
+        self.add_widget(label_row)
+
+        self.hourly.bind(pos=self._redraw_hourly, size=self._redraw_hourly)
+        self.daily.bind(pos=self._redraw_daily, size=self._redraw_daily)
+
+    def set_forecast(self, forecast, now=None):
+        """Show a forecast from OpenMeteoProvider (hourly/daily arrays plus their start times)"""
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+
+        # Hourly values start at local midnight today; skip the hours already past
+        start = max(0, int((now - forecast['hourly_start']) // forecast['hourly_interval']))
+        self.temps = celsius_to_fahrenheit(forecast['hourly_temp'][start:start + HOURS_SHOWN])
+        self.precip = forecast['hourly_precip'][start:start + HOURS_SHOWN]
+
+        self.highs = celsius_to_fahrenheit(forecast['daily_high'][:DAYS_SHOWN])
+        self.lows = celsius_to_fahrenheit(forecast['daily_low'][:DAYS_SHOWN])
+        offset = forecast['utc_offset']
+        for day, label in enumerate(self.day_labels):
+            if day < len(self.highs):
+                when = forecast['daily_start'] + day * forecast['daily_interval'] + offset
+                name = datetime.fromtimestamp(when, timezone.utc).strftime('%a')
+                label.text = f"{name}\n{self.highs[day]:.0f}°/{self.lows[day]:.0f}°"
+            else:
+                label.text = ""
+
+        self._redraw_hourly()
+        self._redraw_daily()
+
+    def _redraw_hourly(self, *args):
+        area = self.hourly
+        if self.temps is None or len(self.temps) < 2 or area.width < 2:
+            self.temp_line.points = []
+            self.precip_bars.vertices, self.precip_bars.indices = [], []
+            return
+        pad = self.pad
+        count = len(self.temps)
+        step = (area.width - 2 * pad) / count
+        xs = area.x + pad + (np.arange(count) + 0.5) * step
+
+        low, high = np.nanmin(self.temps), np.nanmax(self.temps)
+        span = (high - low) or 1.0
+        ys = area.y + pad + (self.temps - low) / span * (area.height - 2 * pad)
+        self.temp_line.points = np.column_stack((xs, ys)).ravel().tolist()
+
+        # Precipitation bars from the bottom edge, up to half the height
+        scale = max(MIN_PRECIP_SCALE, np.nanmax(self.precip))
+        heights = np.nan_to_num(self.precip) / scale * (area.height - 2 * pad) / 2
+        left = xs - step * 0.35
+        self.precip_bars.vertices, self.precip_bars.indices = bar_mesh(
+            left, left + step * 0.7, np.full(count, area.y + pad), area.y + pad + heights)
+
+    def _redraw_daily(self, *args):
+        area = self.daily
+        if self.highs is None or not len(self.highs) or area.width < 2:
+            self.range_bars.vertices, self.range_bars.indices = [], []
+            return
+        pad = self.pad
+        count = len(self.highs)
+        # Same slots as the day labels below
+        slot = area.width / DAYS_SHOWN
+        left = area.x + (np.arange(count) + 0.3) * slot
+
+        low, high = np.nanmin(self.lows), np.nanmax(self.highs)
+        span = (high - low) or 1.0
+        scale = (area.height - 2 * pad) / span
+        self.range_bars.vertices, self.range_bars.indices = bar_mesh(
+            left, left + slot * 0.4,
+            area.y + pad + (self.lows - low) * scale,
+            area.y + pad + (self.highs - low) * scale)
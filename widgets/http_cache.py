@@ -0,0 +1,258 @@
+# widgets/http_cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 300  # Seconds, for sources without a "<source>_cache" entry in cache_settings
+
+
+class CachedResponse:
+    """Enough of a requests.Response for the widgets and the Open-Meteo client"""
+
+    def __init__(self, url, status_code, content, content_type=''):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {'Content-Type': content_type}
+        self.from_cache = True
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code} for {self.url}")
+
+
+class HttpCache:
+    """GET responses cached in two tiers shared by every widget.
+
+    Lookups check an in-memory LRU of `memory_entries` responses first, then a
+    directory of one file per response, capped at `max_disk_megabytes`. An
+    index of the disk tier is kept in memory, so a lookup only touches the disk
+    to read a response the memory tier no longer holds; repeat lookups within
+    the TTL never do. Entries expire after the TTL of their source (from
+    cache_settings), and a background thread drops expired files. Past the
+    size cap the least recently used ones go too, checked after every write.
+
+    Only successful responses are stored, each written once per TTL, and
+    nothing is kept for requests that failed.
+    """
+
+    def __init__(self, path='http_cache', memory_entries=64, max_disk_megabytes=16,
+                 eviction_interval=300, enabled=True, ttls=None):
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (expires_at, CachedResponse)
+        self._disk = None  # key -> [expires_at, size, last_used]; loaded on first use
+        self._evictor = None
+        self._wake = threading.Event()
+        self.ttls = {}
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(path, memory_entries, max_disk_megabytes, eviction_interval, enabled, ttls)
+
+    def configure(self, path='http_cache', memory_entries=64, max_disk_megabytes=16,
+                  eviction_interval=300, enabled=True, ttls=None):
+        """Apply performance_config.json settings (ttls: the cache_settings section)"""
+        with self._lock:
+            if path != getattr(self, 'path', None):
+                self._disk = None  # Re-index the new directory on next use
+            self.path = path
+            self.memory_entries = memory_entries
+            self.max_disk_bytes = max_disk_megabytes * 1024 * 1024
+            self.eviction_interval = eviction_interval
+            self.enabled = enabled
+            if ttls is not None:
+                self.ttls = dict(ttls)
+
+    def ttl_for(self, source):
+        return self.ttls.get(f"{source}_cache", DEFAULT_TTL)
+
+    def session(self, source, timeout=10):
+        """A requests-style session for one source, answering GETs from this cache"""
+        return CachedSession(self, source, timeout)
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.bin")
+
+    def _load_index(self):
+        """Index the disk tier once (directory listing plus one header per file)"""
+        self._disk = {}
+        if not os.path.isdir(self.path):
+            return
+        for name in os.listdir(self.path):
+            if not name.endswith('.bin'):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                with open(path, 'rb') as f:
+                    header = json.loads(f.readline())
+                stat = os.stat(path)
+                self._disk[name[:-4]] = [header['expires'], stat.st_size, stat.st_mtime]
+            except (OSError, ValueError, KeyError):
+                # Partial or foreign file
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def get(self, url):
+        """Cached response for url if one is still fresh, else None"""
+        if not self.enabled:
+            return None
+        key = self.key_for(url)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry[1]
+                del self._memory[key]
+
+            if self._disk is None:
+                self._load_index()
+            indexed = self._disk.get(key)
+            if indexed is None or indexed[0] <= now:
+                self.misses += 1
+                return None
+            try:
+                with open(self._file(key), 'rb') as f:
+                    header = json.loads(f.readline())
+                    response = CachedResponse(url, header['status'], f.read(), header.get('type', ''))
+            except (OSError, ValueError, KeyError):
+                self._disk.pop(key, None)
+                self.misses += 1
+                return None
+            indexed[2] = now
+            self.disk_hits += 1
+            self._remember(key, header['expires'], response)
+            return response
+
+    def put(self, url, response, ttl):
+        """Store a successful response for `ttl` seconds in both tiers"""
+        if not self.enabled or response.status_code != 200 or ttl <= 0:
+            return
+        key = self.key_for(url)
+        expires = time.time() + ttl
+        cached = CachedResponse(url, response.status_code, response.content,
+                                response.headers.get('Content-Type', ''))
+        header = json.dumps({'expires': expires, 'status': cached.status_code,
+                             'type': cached.headers['Content-Type']}).encode()
+
+        with self._lock:
+            self._remember(key, expires, cached)
+            if self._disk is None:
+                self._load_index()
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                tmp_path = self._file(key) + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(header + b'\n' + cached.content)
+                os.replace(tmp_path, self._file(key))
+                self._disk[key] = [expires, len(header) + 1 + len(cached.content), time.time()]
+            except OSError as e:
+                print(f"[HttpCache] Could not write to {self.path}: {e}")
+            over_cap = sum(size for _, size, _ in self._disk.values()) > self.max_disk_bytes
+            # Under the lock, or concurrent puts could each start an evictor
+            self._start_evictor()
+        if over_cap:
+            # Don't wait up to eviction_interval to get back under the cap
+            self.evict()
+
+    def _remember(self, key, expires, response):
+        self._memory[key] = (expires, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _start_evictor(self):
+        if self._evictor is None and self.eviction_interval:
+            self._evictor = threading.Thread(target=self._evict_loop, name='http-cache-evict',
+                                             daemon=True)
+            self._evictor.start()
+
+    def _evict_loop(self):
+        while not self._wake.wait(self.eviction_interval):
+            self.evict()
+
+    def evict(self):
+        """Drop expired files, then least recently used ones past the size cap"""
+        now = time.time()
+        with self._lock:
+            if self._disk is None:
+                return
+            doomed = {key for key, (expires, _, _) in self._disk.items() if expires <= now}
+            total = sum(size for key, (_, size, _) in self._disk.items() if key not in doomed)
+            if total > self.max_disk_bytes:
+                live = sorted((last_used, key) for key, (expires, _, last_used)
+                              in self._disk.items() if expires > now)
+                for _, key in live:
+                    if total <= self.max_disk_bytes:
+                        break
+                    total -= self._disk[key][1]
+                    doomed.add(key)
+
+            for key in doomed:
+                del self._disk[key]
+                self._memory.pop(key, None)
+                try:
+                    os.remove(self._file(key))
+                except OSError:
+                    pass
+            self.evictions += len(doomed)
+        if doomed:
+            print(f"[HttpCache] Evicted {len(doomed)} responses; {self.stats()}")
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hit_rate = (self.memory_hits + self.disk_hits) / lookups * 100 if lookups else 0
+        return (f"{self.memory_hits} memory hits, {self.disk_hits} disk hits, "
+                f"{self.misses} misses ({hit_rate:.0f}% hit rate), {self.evictions} evicted")
+
+    def stop(self):
+        self._wake.set()
+
+
+class CachedSession:
+    """requests-style session for one source: GETs go through the shared HttpCache"""
+
+    def __init__(self, cache, source, timeout=10):
+        self.cache = cache
+        self.source = source
+        self.timeout = timeout
+        self._session = None
+
+    def get(self, url, params=None, **kwargs):
+        # Imported here so importing the cache never pulls requests into boot
+        import requests
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        cached = self.cache.get(full_url)
+        if cached is not None:
+            return cached
+
+        if self._session is None:
+            self._session = requests.Session()
+        kwargs.setdefault('timeout', self.timeout)
+        response = self._session.get(full_url, **kwargs)
+        self.cache.put(full_url, response, self.cache.ttl_for(self.source))
+        return response
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+# Shared HTTP cache used by the network widgets
+http_cache = HttpCache()
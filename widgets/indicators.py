@@ -0,0 +1,245 @@
+# widgets/indicators.py
+
+import numpy as np
+
+# "changes" option -> look-back in seconds
+CHANGE_WINDOWS = {
+    '1h': 3600,
+    '1d': 86400,
+    '5d': 5 * 86400,
+    '1mo': 30 * 86400,
+    '3mo': 91 * 86400,
+    '1y': 365 * 86400,
+}
+
+# Shifting UTC by -5h puts every US pre/regular/post-market bar on its own
+# calendar day in both EST and EDT, so sessions split on whole days
+US_SESSION_OFFSET = -5 * 3600
+
+EMA_CHUNK = 256  # Bars per closed-form EMA block; keeps decay powers well inside float range
+
+
+def sma_tail(close, start, window):
+    """Simple moving average for bars start..end of close (NaN until a full window)"""
+    low = max(0, start - window + 1)
+    sums = np.concatenate(([0.0], np.cumsum(close[low:])))
+    index = np.arange(start, len(close))
+    ends = index - low + 1
+    begins = index - window + 1 - low
+    out = np.full(len(index), np.nan)
+    valid = begins >= 0
+    out[valid] = (sums[ends[valid]] - sums[begins[valid]]) / window
+    return out
+
+
+def ema_continue(values, alpha, previous):
+    """Exponential moving average of values, continuing from `previous`.
+
+    Vectorized per block with the closed form
+    ema[i] = d^(i+1) * (previous + alpha * sum_{j<=i} x[j] / d^(j+1)), d = 1 - alpha.
+    """
+    decay = 1.0 - alpha
+    out = np.empty(len(values))
+    for start in range(0, len(values), EMA_CHUNK):
+        chunk = values[start:start + EMA_CHUNK]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        block = powers * (previous + alpha * np.cumsum(chunk / powers))
+        out[start:start + len(chunk)] = block
+        previous = block[-1]
+    return out
+
+
+def _day_starts(days, previous_day):
+    """True where a bar opens a new session day"""
+    starts = np.empty(len(days), dtype=bool)
+    starts[0] = previous_day is None or days[0] != previous_day
+    starts[1:] = days[1:] != days[:-1]
+    return starts
+
+
+def _cumsum_by_day(values, starts, previous_total):
+    """Running per-day total of values, continuing previous_total until the first day start"""
+    totals = np.cumsum(values)
+    before = totals - values  # Running total just before each bar
+    # Index of the day start each bar belongs to (-1 = continuing the previous day)
+    anchor = np.maximum.accumulate(np.where(starts, np.arange(len(values)), -1))
+    return np.where(anchor >= 0, totals - before[np.maximum(anchor, 0)], previous_total + totals)
+
+
+def _running_extreme_by_day(values, starts, previous, take_max):
+    """Per-day running max (or min) of values, continuing `previous` until the first day start"""
+    sign = 1.0 if take_max else -1.0
+    values = sign * values
+    group = np.cumsum(starts)  # 0 for bars continuing the previous day
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return np.full(len(values), np.nan)
+    # Lift each later day above every earlier one so a single accumulate restarts per day
+    lift = (finite.max() - finite.min() + 1.0) * group
+    out = np.fmax.accumulate(values + lift) - lift
+    if previous is not None and np.isfinite(previous):
+        first_day = group == 0
+        out[first_day] = np.fmax(out[first_day], sign * previous)
+    return sign * out
+
+
+class IndicatorSet:
+    """Chart overlays and stats for one price series, updated incrementally.
+
+    Results are kept in arrays aligned with the series by bar time. When the next
+    series only drops bars off the front and/or changes or appends bars at the
+    end (the normal case for a rolling window with a forming last bar), only the
+    bars from the last known one onward are computed, reusing the EMA, VWAP and
+    day-range state of the bar before. Anything else recomputes from scratch.
+    Per-update cost therefore depends on how many bars changed, not on history.
+    """
+
+    def __init__(self, sma=(), ema=(), vwap=False, day_range=False, changes=(),
+                 session_offset=US_SESSION_OFFSET):
+        self.sma = tuple(int(window) for window in sma)
+        self.ema = tuple(int(span) for span in ema if int(span) >= 2)
+        self.vwap = vwap
+        self.day_range = day_range
+        self.changes = tuple(label for label in changes if label in CHANGE_WINDOWS)
+        self.session_offset = session_offset
+
+        names = ['time', 'day']
+        names += [f'sma_{window}' for window in self.sma]
+        names += [f'ema_{span}' for span in self.ema]
+        if vwap:
+            names += ['vwap', 'cum_pv', 'cum_v']
+        if day_range:
+            names += ['day_high', 'day_low']
+        self._names = names
+        self._columns = {name: np.empty(0) for name in names}
+        self._base = 0  # Column index of the series' first bar
+        self._count = 0
+
+        self.computed_bars = 0  # Bars computed by the last update, for profiling
+
+    def _resume_index(self, times):
+        """First bar of `times` that needs computing; realigns the columns to the series"""
+        if not self._count or not len(times):
+            return 0
+        held = self._columns['time'][self._base:self._base + self._count]
+        offset = int(np.searchsorted(held, times[0]))
+        last = self._count - 1
+        resume = last - offset
+        if (offset > last or held[offset] != times[0]
+                or resume >= len(times) or times[resume] != held[last]):
+            return 0
+        self._base += offset
+        self._count -= offset
+        # Recompute the newest held bar too: it may still have been forming
+        return resume
+
+    def _reserve(self, length):
+        """Make room for `length` bars from self._base (amortized O(1) per appended bar)"""
+        capacity = len(self._columns['time'])
+        if self._base + length <= capacity:
+            return
+        keep = self._count
+        new_capacity = max(64, 2 * length) if length > capacity // 2 else capacity
+        for name, column in self._columns.items():
+            grown = np.empty(new_capacity)
+            grown[:keep] = column[self._base:self._base + keep]
+            self._columns[name] = grown
+        self._base = 0
+
+    def update(self, series):
+        """Bring the indicators up to date with series; returns overlays and stats"""
+        times = series['time']
+        close = np.asarray(series['close'], dtype=float)
+        n = len(times)
+        start = self._resume_index(times)
+        if start == 0:
+            self._base = 0
+            self._count = 0
+        self._reserve(n)
+        self.computed_bars = n - start
+
+        if start < n:
+            self._compute(series, times, close, start)
+        self._count = n
+        return self._result(times, close)
+
+    def _column(self, name, start=0, stop=None):
+        stop = self._count if stop is None else stop
+        return self._columns[name][self._base + start:self._base + stop]
+
+    def _previous(self, name, start):
+        return self._columns[name][self._base + start - 1] if start else None
+
+    def _compute(self, series, times, close, start):
+        n = len(times)
+        section = slice(self._base + start, self._base + n)
+        cols = self._columns
+
+        cols['time'][section] = times[start:]
+        days = np.floor((times[start:] + self.session_offset) / 86400)
+        previous_day = self._previous('day', start)
+        cols['day'][section] = days
+
+        for window in self.sma:
+            cols[f'sma_{window}'][section] = sma_tail(close, start, window)
+
+        for span in self.ema:
+            name = f'ema_{span}'
+            previous = self._previous(name, start)
+            if previous is None or not np.isfinite(previous):
+                previous = close[start]
+            cols[name][section] = ema_continue(close[start:], 2.0 / (span + 1), previous)
+
+        if not (self.vwap or self.day_range):
+            return
+
+        starts = _day_starts(days, previous_day)
+        high = np.asarray(series.get('high', close), dtype=float)[start:]
+        low = np.asarray(series.get('low', close), dtype=float)[start:]
+        # Snapshot-seeded bars may only carry a close
+        high = np.where(np.isfinite(high), high, close[start:])
+        low = np.where(np.isfinite(low), low, close[start:])
+
+        if self.vwap:
+            volume = series.get('volume')
+            volume = np.zeros(n - start) if volume is None else np.nan_to_num(
+                np.asarray(volume[start:], dtype=float))
+            typical = (high + low + close[start:]) / 3
+            previous_pv = self._previous('cum_pv', start) or 0.0
+            previous_v = self._previous('cum_v', start) or 0.0
+            cum_pv = _cumsum_by_day(typical * volume, starts, previous_pv)
+            cum_v = _cumsum_by_day(volume, starts, previous_v)
+            cols['cum_pv'][section] = cum_pv
+            cols['cum_v'][section] = cum_v
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cols['vwap'][section] = np.where(cum_v > 0, cum_pv / cum_v, np.nan)
+
+        if self.day_range:
+            cols['day_high'][section] = _running_extreme_by_day(
+                high, starts, self._previous('day_high', start), take_max=True)
+            cols['day_low'][section] = _running_extreme_by_day(
+                low, starts, self._previous('day_low', start), take_max=False)
+
+    def _result(self, times, close):
+        overlays = {}
+        for window in self.sma:
+            overlays[f'SMA {window}'] = self._column(f'sma_{window}')
+        for span in self.ema:
+            overlays[f'EMA {span}'] = self._column(f'ema_{span}')
+        if self.vwap:
+            overlays['VWAP'] = self._column('vwap')
+
+        stats = {}
+        if self._count and self.day_range:
+            last = self._base + self._count - 1
+            stats['day_range'] = (float(self._columns['day_low'][last]),
+                                  float(self._columns['day_high'][last]))
+        if self._count and self.changes:
+            changes = {}
+            for label in self.changes:
+                # Last close at or before the start of the window
+                index = int(np.searchsorted(times, times[-1] - CHANGE_WINDOWS[label], side='right')) - 1
+                if index >= 0 and close[index]:
+                    changes[label] = (close[-1] / close[index] - 1) * 100
+            stats['changes'] = changes
+        return {'overlays': overlays, 'stats': stats}
@@ -0,0 +1,108 @@
+# widgets/market_hours.py
+
+import time
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+PRE = 'pre'
+REGULAR = 'regular'
+POST = 'post'
+CLOSED = 'closed'
+
+
+def _parse_time(value):
+    hours, minutes = value.split(':')
+    return int(hours), int(minutes)
+
+
+class MarketCalendar:
+    """Trading sessions of one exchange (weekdays, minus configured holidays).
+
+    Tells the finance widgets how long to wait before their next poll: the
+    normal interval during the regular session, a slower one (or none at all)
+    in pre/post market, and otherwise exactly the time until the next session
+    opens. Prices can't move while the market is closed, so neither should we.
+    """
+
+    def __init__(self, **settings):
+        self.configure(**settings)
+
+    def configure(self, enabled=True, timezone='America/New_York', pre_market='04:00',
+                  open='09:30', close='16:00', post_market='20:00', extended_hours=False,
+                  extended_interval=600, close_grace=300, holidays=()):
+        """Apply performance_config.json settings"""
+        self.enabled = enabled
+        self.tz = ZoneInfo(timezone)
+        self.pre_market = _parse_time(pre_market)
+        self.open = _parse_time(open)
+        self.close = _parse_time(close)
+        self.post_market = _parse_time(post_market)
+        self.extended_hours = extended_hours  # Poll (and chart) pre/post market too
+        self.extended_interval = extended_interval
+        self.close_grace = close_grace  # Keep polling this long after a close for the final bar
+        self.holidays = {date.fromisoformat(day) for day in holidays}
+
+    def is_trading_day(self, day):
+        return day.weekday() < 5 and day not in self.holidays
+
+    def _at(self, day, hours_minutes):
+        hours, minutes = hours_minutes
+        return datetime(day.year, day.month, day.day, hours, minutes, tzinfo=self.tz).timestamp()
+
+    def session(self, now=None):
+        """PRE, REGULAR, POST or CLOSED at `now` (epoch seconds)"""
+        now = time.time() if now is None else now
+        day = datetime.fromtimestamp(now, self.tz).date()
+        if not self.is_trading_day(day):
+            return CLOSED
+        if self._at(day, self.open) <= now < self._at(day, self.close):
+            return REGULAR
+        if self._at(day, self.pre_market) <= now < self._at(day, self.open):
+            return PRE
+        if self._at(day, self.close) <= now < self._at(day, self.post_market):
+            return POST
+        return CLOSED
+
+    def next_open(self, now=None):
+        """Epoch seconds of the next session start we poll in (pre-market if extended hours)"""
+        now = time.time() if now is None else now
+        start = self.pre_market if self.extended_hours else self.open
+        day = datetime.fromtimestamp(now, self.tz).date()
+        # Long weekends plus holidays never span more than a couple of weeks
+        for offset in range(15):
+            candidate = day + timedelta(days=offset)
+            if self.is_trading_day(candidate) and self._at(candidate, start) > now:
+                return self._at(candidate, start)
+        return None
+
+    def _last_close(self, now):
+        """Epoch seconds of today's polling end (regular or post-market close), if a trading day"""
+        day = datetime.fromtimestamp(now, self.tz).date()
+        if not self.is_trading_day(day):
+            return None
+        return self._at(day, self.post_market if self.extended_hours else self.close)
+
+    def next_poll_delay(self, interval, now=None):
+        """Seconds until the next poll for a widget that normally polls every `interval`"""
+        if not self.enabled:
+            return interval
+        now = time.time() if now is None else now
+        session = self.session(now)
+        if session == REGULAR:
+            return interval
+        if session in (PRE, POST) and self.extended_hours:
+            return max(interval, self.extended_interval)
+
+        # One last poll shortly after the close picks up the final bar
+        last_close = self._last_close(now)
+        if last_close is not None and last_close <= now < last_close + self.close_grace:
+            return interval
+
+        next_open = self.next_open(now)
+        if next_open is None:
+            return interval
+        return max(0.0, next_open - now)
+
+
+# Shared calendar for the finance widgets
+market_calendar = MarketCalendar()
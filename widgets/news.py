@@ -1,13 +1,57 @@
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.scrollview import ScrollView
-import requests
 import json
 from datetime import datetime
 import time
+from widgets.http_cache import http_cache
+from widgets.providers import DataProvider, providers
+from widgets.snapshot import format_age
+
+# Sample headlines shown when no NewsAPI key is configured
+SAMPLE_NEWS = [
+    "Tech: Raspberry Pi 5 now available with improved performance",
+    "Weather: Sunny skies expected for the weekend",
+    "Local: Community garden project receives funding",
+    "Sports: Local team wins championship game",
+    "Science: New AI developments in machine learning"
+]
+
+
+class NewsProvider(DataProvider):
+    """Top headlines for one API key, shared by all news widgets using it"""
+
+    source = 'newsapi'
+
+    def fetch(self):
+        """Fetch headlines (runs on a worker thread)"""
+        api_key, = self.params
+        if api_key == "YOUR_NEWS_API_KEY":
+            # Without an API key, fall back to some sample news items
+            return list(SAMPLE_NEWS)
+        return self._fetch_with_api_key(api_key)
+
+    def _fetch_with_api_key(self, api_key):
+        """Fetch headlines from NewsAPI.org (requires API key)"""
+        url = "https://newsapi.org/v2/top-headlines"
+        params = {
+            "country": "us",
+            "apiKey": api_key,
+            "pageSize": 5
+        }
+        
+        # Served from the shared HTTP cache within news_cache seconds
+        response = http_cache.session('news').get(url, params=params, timeout=10)
+        if response.status_code != 200:
+            raise RuntimeError(f"News API error ({response.status_code})")
+
+        data = response.json()
+        articles = data.get('articles', [])
+        return [article.get('title', 'No title') for article in articles]
+
 
 class NewsWidget(BoxLayout):
-    def __init__(self, **kwargs):
+    def __init__(self, api_key="YOUR_NEWS_API_KEY", **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.padding = 5
@@ -26,7 +70,7 @@ class NewsWidget(BoxLayout):
         self.add_widget(self.title_label)
         
         # News API key (you'll need to get a free key from newsapi.org)
-        self.api_key = "YOUR_NEWS_API_KEY"  # Replace with your API key
+        self.api_key = api_key  # Set "api_key" in the widget's options
         self.news_items = []
         
         # Cache for news data
@@ -34,12 +78,21 @@ class NewsWidget(BoxLayout):
         self.cached_data = None
         self.update_interval = 600  # 10 minutes
         self.first_update = True  # Flag for first update
+        self.stale = False  # True while showing data restored from a snapshot
+
+        # News widgets with the same key share one provider (and one fetch)
+        self.provider = providers.get(NewsProvider, api_key)
+        self.provider.subscribe(self, self._apply_news, self._on_fetch_error)
+
+    def release(self):
+        """Stop receiving data when the widget is removed from the dashboard"""
+        providers.release(self.provider, self)
 
     def render(self, parent):
         parent.add_widget(self)
         self.update()
 
-    def update(self):
+    def update(self, force=False):
         current_time = time.time()
         
         # Skip cache check on first update or if forced
@@ -48,39 +101,43 @@ class NewsWidget(BoxLayout):
             self.last_update = 0  # Force update
         
         # Only update if enough time has passed
-        if current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
+        if not force and current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
             return
             
-        try:
-            # Use a free news API (you can replace with your preferred source)
-            # For demo purposes, we'll use a simple RSS-like approach
-            self._fetch_news()
-        except Exception as e:
-            print(f"News update failed: {e}")
+        # Reuse headlines another widget fetched within the last half interval
+        self.provider.request(self, max_age=self.update_interval / 2)
+
+    def _apply_news(self, news_items):
+        """Show freshly fetched headlines (UI thread)"""
+        # Cache the data
+        self.cached_data = news_items
+        self.last_update = time.time()
+        self.stale = False
+        self.title_label.text = "Latest News"
+
+        self._display_news(news_items)
+
+    def _on_fetch_error(self, e):
+        print(f"News update failed: {e}")
+        # Keep showing cached headlines if we have them, marked with their age
+        if self.cached_data:
+            self.title_label.text = f"Latest News (cached {format_age(time.time() - self.last_update)} ago)"
+            self._display_news(self.cached_data)
+        else:
             self._show_error(f"Error: {e}")
 
-    def _fetch_news(self):
-        """Fetch news from a free API"""
-        try:
-            # Using a free news API - you can replace with your preferred source
-            # For now, we'll create some sample news items
-            sample_news = [
-                "Tech: Raspberry Pi 5 now available with improved performance",
-                "Weather: Sunny skies expected for the weekend",
-                "Local: Community garden project receives funding",
-                "Sports: Local team wins championship game",
-                "Science: New AI developments in machine learning"
-            ]
-            
-            # Cache the data
-            self.cached_data = sample_news
-            self.last_update = time.time()
-            
-            self._display_news(sample_news)
-            
-        except Exception as e:
-            print(f"News fetch failed: {e}")
-            self._show_error("Unable to fetch news")
+    def get_snapshot(self):
+        """Last good headlines for the warm-start snapshot"""
+        return self.cached_data
+
+    def restore_snapshot(self, data, fetched_at):
+        """Show saved headlines until fresh ones arrive"""
+        self.cached_data = data
+        self.last_update = fetched_at
+        self.first_update = False
+        self.stale = True
+        self.title_label.text = f"Latest News (cached {format_age(time.time() - fetched_at)} ago)"
+        self._display_news(data)
 
     def _display_news(self, news_items):
         """Display news items in the widget"""
@@ -110,27 +167,3 @@ class NewsWidget(BoxLayout):
             height=30
         )
         self.news_container.add_widget(error_label)
-
-    def _fetch_with_api_key(self):
-        """Alternative method using NewsAPI.org (requires API key)"""
-        if self.api_key == "YOUR_NEWS_API_KEY":
-            return
-            
-        url = "https://newsapi.org/v2/top-headlines"
-        params = {
-            "country": "us",
-            "apiKey": self.api_key,
-            "pageSize": 5
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                articles = data.get('articles', [])
-                news_items = [article.get('title', 'No title') for article in articles]
-                self._display_news(news_items)
-            else:
-                self._show_error("News API error")
-        except Exception as e:
-            self._show_error(f"API Error: {e}") 
\ No newline at end of file
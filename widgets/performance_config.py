@@ -0,0 +1,126 @@
+# widgets/performance_config.py
+
+import json
+import os
+
+PERFORMANCE_CONFIG_FILE = "performance_config.json"
+
+DEFAULT_PERFORMANCE_CONFIG = {
+    "update_intervals": {
+        "clock": 1,
+        "weather": 300,
+        "finance": 120,
+        "watchlist": 120,
+        "system_monitor": 10,
+        "news": 600,
+        "calendar": 300,
+        "quote": 1800
+    },
+    "cache_settings": {
+        "weather_cache": 1800,
+        "finance_cache": 120,
+        "system_cache": 10,
+        "news_cache": 600,
+        "calendar_cache": 300
+    },
+    "http_cache": {
+        "enabled": True,
+        "path": "http_cache",
+        "memory_entries": 64,
+        "max_disk_megabytes": 16,
+        "eviction_interval": 300
+    },
+    "scheduler": {
+        "coalesce_window": 2.0
+    },
+    "snapshot": {
+        "enabled": True,
+        "path": "dashboard_state.json",
+        "save_interval": 300
+    },
+    "startup": {
+        "network_spread": 5.0,
+        "jitter": 1.0,
+        "report_timeout": 60
+    },
+    "clock": {
+        "smooth_sweep": False,
+        "sweep_fps": 10,
+        "jitter_log_interval": 60
+    },
+    "circuit_breaker": {
+        "failure_threshold": 3,
+        "base_delay": 30,
+        "max_delay": 1800,
+        "jitter": 0.2,
+        "probe_timeout": 60,
+        "status_file": "breaker_state.json"
+    },
+    "price_store": {
+        "enabled": True,
+        "path": "price_history",
+        "retention_days": 400
+    },
+    "streaming": {
+        "url": "ws://localhost:8765",
+        "ui_rate": 4,
+        "poll_interval": 900
+    },
+    "chart_cache": {
+        "max_megabytes": 24,
+        "resize_debounce": 0.3
+    },
+    "market_hours": {
+        "enabled": True,
+        "timezone": "America/New_York",
+        "pre_market": "04:00",
+        "open": "09:30",
+        "close": "16:00",
+        "post_market": "20:00",
+        "extended_hours": False,
+        "extended_interval": 600,
+        "close_grace": 300,
+        # NYSE full-day closures
+        "holidays": [
+            "2026-01-01",
+            "2026-01-19",
+            "2026-02-16",
+            "2026-04-03",
+            "2026-05-25",
+            "2026-06-19",
+            "2026-07-03",
+            "2026-09-07",
+            "2026-11-26",
+            "2026-12-25",
+            "2027-01-01",
+            "2027-01-18",
+            "2027-02-15",
+            "2027-03-26",
+            "2027-05-31",
+            "2027-06-18",
+            "2027-07-05",
+            "2027-09-06",
+            "2027-11-25",
+            "2027-12-24"
+        ]
+    }
+}
+
+
+def load_performance_config(path=PERFORMANCE_CONFIG_FILE):
+    """Load performance settings, filling in anything missing from the defaults"""
+    config = {section: dict(values) for section, values in DEFAULT_PERFORMANCE_CONFIG.items()}
+
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                loaded = json.load(f)
+            for section, values in loaded.items():
+                if isinstance(values, dict):
+                    config.setdefault(section, {}).update(values)
+                else:
+                    config[section] = values
+    except Exception as e:
+        print(f"Error loading performance config: {e}")
+
+    return config
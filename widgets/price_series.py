@@ -0,0 +1,101 @@
+# widgets/price_series.py
+
+import numpy as np
+
+# Per-bar values kept alongside each bar's timestamp
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def normalize_bars(times, columns):
+    """Sort bars by time, drop duplicate timestamps, and fill missing fields with NaN"""
+    times, first = np.unique(np.asarray(times, dtype=float), return_index=True)
+    values = {}
+    for name in BAR_FIELDS:
+        column = columns.get(name)
+        values[name] = (np.full(len(times), np.nan) if column is None
+                        else np.asarray(column, dtype=float)[first])
+    return times, values
+
+
+class PriceBuffer:
+    """Fixed-size ring buffer of price bars in NumPy arrays.
+
+    Bars are kept in timestamp order. Merging a batch appends bars newer than
+    the last one held (overwriting the oldest once full) and overwrites bars
+    whose timestamp is already held, which is how a still-forming bar gets its
+    final values. Nothing is reallocated after construction.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.times = np.zeros(capacity)  # Bar start, epoch seconds
+        self.fields = {name: np.full(capacity, np.nan) for name in BAR_FIELDS}
+        self.start = 0  # Slot of the oldest bar
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def last_time(self):
+        """Timestamp of the newest bar, or None when empty"""
+        if not self.count:
+            return None
+        return float(self.times[(self.start + self.count - 1) % self.capacity])
+
+    def last_bar(self):
+        """Field values of the newest bar, or None when empty"""
+        if not self.count:
+            return None
+        slot = (self.start + self.count - 1) % self.capacity
+        return {name: float(self.fields[name][slot]) for name in BAR_FIELDS}
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
+
+    def _slots(self):
+        """Slot indices from oldest to newest"""
+        return (self.start + np.arange(self.count)) % self.capacity
+
+    def merge(self, times, columns):
+        """Merge bars (times plus arrays keyed by BAR_FIELDS); returns how many are new"""
+        if not len(times):
+            return 0
+        times, values = normalize_bars(times, columns)
+
+        # Bars we already hold: overwrite the matching slots in place
+        last_time = self.last_time
+        is_new = np.ones(len(times), dtype=bool) if last_time is None else times > last_time
+        if not is_new.all():
+            slots = self._slots()
+            held = self.times[slots]
+            old_times = times[~is_new]
+            pos = np.minimum(np.searchsorted(held, old_times), len(held) - 1)
+            match = held[pos] == old_times
+            targets = slots[pos[match]]
+            for name in BAR_FIELDS:
+                self.fields[name][targets] = values[name][~is_new][match]
+
+        # Newer bars: append, pushing out the oldest once the buffer is full
+        new_times = times[is_new][-self.capacity:]
+        added = len(new_times)
+        if added:
+            targets = (self.start + self.count + np.arange(added)) % self.capacity
+            self.times[targets] = new_times
+            for name in BAR_FIELDS:
+                self.fields[name][targets] = values[name][is_new][-self.capacity:]
+            overflow = max(0, self.count + added - self.capacity)
+            self.start = (self.start + overflow) % self.capacity
+            self.count = min(self.capacity, self.count + added)
+        return added
+
+    def series(self, since=None):
+        """Ordered copies of the held bars ('time' plus BAR_FIELDS), optionally from `since` on"""
+        slots = self._slots()
+        if since is not None:
+            slots = slots[self.times[slots] >= since]
+        data = {'time': self.times[slots]}
+        for name in BAR_FIELDS:
+            data[name] = self.fields[name][slots]
+        return data
@@ -0,0 +1,161 @@
+# widgets/price_store.py
+
+import os
+import threading
+import time
+import numpy as np
+from widgets.price_series import BAR_FIELDS, normalize_bars
+
+STORE_COLUMNS = ('time',) + BAR_FIELDS
+COMPACT_SLACK = 7 * 86400  # Let expired bars pile up this long before rewriting
+
+
+class PriceStore:
+    """On-disk price history, one directory per symbol and bar interval.
+
+    Each column (time, open, high, low, close, volume) is a flat file of
+    little-endian float64 values in timestamp order. New bars are appended and
+    the still-forming last bar is overwritten in place, so routine writes touch a
+    few bytes. Reads memory-map the columns and binary-search the time column,
+    so a range is read without loading whole files. Bars older than
+    `retention_days` are compacted away.
+
+    Writes happen on fetch worker threads and reads on the UI thread; one lock
+    keeps them from interleaving.
+    """
+
+    def __init__(self, path='price_history', retention_days=400, enabled=True):
+        self.path = path
+        self.retention_days = retention_days
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    def configure(self, path='price_history', retention_days=400, enabled=True):
+        """Apply performance_config.json settings"""
+        self.path = path
+        self.retention_days = retention_days
+        self.enabled = enabled
+
+    def _dir(self, symbol, interval):
+        return os.path.join(self.path, f"{symbol}_{interval}")
+
+    def _column_path(self, symbol, interval, column):
+        return os.path.join(self._dir(symbol, interval), f"{column}.f8")
+
+    def _length(self, symbol, interval):
+        """Bars stored; the shortest column wins if a write was interrupted"""
+        lengths = []
+        for column in STORE_COLUMNS:
+            path = self._column_path(symbol, interval, column)
+            lengths.append(os.path.getsize(path) // 8 if os.path.exists(path) else 0)
+        return min(lengths)
+
+    def _map(self, symbol, interval, mode='r'):
+        """Memory-map every column, or None if nothing is stored"""
+        length = self._length(symbol, interval)
+        if not length:
+            return None
+        return {column: np.memmap(self._column_path(symbol, interval, column),
+                                  dtype='<f8', mode=mode, shape=(length,))
+                for column in STORE_COLUMNS}
+
+    def span(self, symbol, interval):
+        """(first, last) bar time, or None if nothing is stored"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            columns = self._map(symbol, interval)
+            if columns is None:
+                return None
+            times = columns['time']
+            return float(times[0]), float(times[-1])
+
+    def read(self, symbol, interval, since=None):
+        """Bars from `since` on ('time' plus BAR_FIELDS arrays), or None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            columns = self._map(symbol, interval)
+            if columns is None:
+                return None
+            start = 0 if since is None else int(np.searchsorted(columns['time'], since))
+            # Copy the slice out so no file stays mapped
+            return {column: np.array(values[start:]) for column, values in columns.items()}
+
+    def merge(self, symbol, interval, times, columns):
+        """Store bars, overwriting any already held; returns how many are new"""
+        if not self.enabled or not len(times):
+            return 0
+        times, values = normalize_bars(times, columns)
+        values['time'] = times
+
+        with self._lock:
+            os.makedirs(self._dir(symbol, interval), exist_ok=True)
+            length = self._length(symbol, interval)
+            for column in STORE_COLUMNS:
+                # Drop any partial tail left by an interrupted append
+                path = self._column_path(symbol, interval, column)
+                if os.path.exists(path) and os.path.getsize(path) != length * 8:
+                    os.truncate(path, length * 8)
+
+            stored = self._map(symbol, interval, mode='r+')
+            if stored is not None and times[0] < stored['time'][0]:
+                # Backfill of older history: the only case that rewrites files
+                # (incoming bars come first, so they win over stored duplicates)
+                merged = {column: np.concatenate((values[column], stored[column]))
+                          for column in STORE_COLUMNS}
+                del stored
+                merged_times, merged_values = normalize_bars(merged['time'], merged)
+                merged_values['time'] = merged_times
+                self._rewrite(symbol, interval, merged_values)
+                added = len(merged_times) - length
+            else:
+                is_new = np.ones(len(times), dtype=bool)
+                if stored is not None:
+                    held = stored['time']
+                    is_new = times > held[-1]
+                    old = ~is_new
+                    if old.any():
+                        # Overwrite bars we already hold (the forming bar) in place
+                        pos = np.minimum(np.searchsorted(held, times[old]), len(held) - 1)
+                        match = held[pos] == times[old]
+                        for name in BAR_FIELDS:
+                            stored[name][pos[match]] = values[name][old][match]
+                        for values_map in stored.values():
+                            values_map.flush()
+                    del stored
+
+                added = int(is_new.sum())
+                for column in STORE_COLUMNS:
+                    with open(self._column_path(symbol, interval, column), 'ab') as f:
+                        f.write(values[column][is_new].astype('<f8').tobytes())
+
+            self._compact_if_needed(symbol, interval)
+        return added
+
+    def _rewrite(self, symbol, interval, values):
+        """Replace every column file with `values` (tmp file + rename per column)"""
+        for column in STORE_COLUMNS:
+            path = self._column_path(symbol, interval, column)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(np.asarray(values[column]).astype('<f8').tobytes())
+            os.replace(tmp_path, path)
+
+    def _compact_if_needed(self, symbol, interval):
+        """Drop bars past retention once enough of them have built up"""
+        if not self.retention_days:
+            return
+        cutoff = time.time() - self.retention_days * 86400
+        columns = self._map(symbol, interval)
+        if columns is None or columns['time'][0] > cutoff - COMPACT_SLACK:
+            return
+        start = int(np.searchsorted(columns['time'], cutoff))
+        kept = {column: np.array(values[start:]) for column, values in columns.items()}
+        del columns
+        self._rewrite(symbol, interval, kept)
+        print(f"[PriceStore] Compacted {symbol} {interval}: dropped {start} bars")
+
+
+# Shared price history used by the finance provider
+price_store = PriceStore()
@@ -0,0 +1,135 @@
+# widgets/providers.py
+
+import functools
+import time
+from abc import ABC, abstractmethod
+from widgets.circuit_breaker import CircuitOpenError, breakers
+from widgets.fetch_executor import fetch_executor
+
+
+class DataProvider(ABC):
+    """One upstream data source shared by every widget that displays it.
+
+    Subclasses set `source` and implement fetch(), which runs on the fetch
+    executor with the arguments fetch_args() returned on the UI thread. Each
+    result is pushed to all subscribers on the UI thread, and requests for
+    data younger than the caller's max_age are served from memory, so
+    upstream calls scale with distinct sources, not widget count.
+
+    Every provider for the same source shares one circuit breaker; while it is
+    open, requests fail fast with CircuitOpenError and widgets keep showing
+    their cached data.
+    """
+
+    source = None
+
+    def __init__(self, *params):
+        self.params = params
+        self.data = None
+        self.fetched_at = 0
+        self.subscribers = {}  # id(owner) -> (on_data, on_error)
+        self._recheck = None  # Smallest max_age of requests that joined a fetch in flight
+        self.breaker = breakers.get(self.source)
+
+    @property
+    def key(self):
+        return (self.source, self.params)
+
+    def fetch_args(self):
+        """Arguments for the next fetch(), read on the UI thread.
+
+        Subscribers come and go on the UI thread while fetch() runs, so a fetch
+        must only use state copied here, never the provider's own dicts.
+        """
+        return ()
+
+    @abstractmethod
+    def fetch(self, *args):
+        """Fetch fresh data (runs on a worker thread)"""
+
+    def subscribe(self, owner, on_data, on_error=None):
+        self.subscribers[id(owner)] = (on_data, on_error)
+
+    def unsubscribe(self, owner):
+        self.subscribers.pop(id(owner), None)
+        if not self.subscribers:
+            # Nobody is left to show the result
+            fetch_executor.cancel(self)
+
+    def is_fresh(self, max_age):
+        return self.data is not None and time.time() - self.fetched_at < max_age
+
+    def request(self, owner, max_age):
+        """Get data to owner: from memory if fresh, otherwise via one shared fetch"""
+        if self.is_fresh(max_age):
+            on_data, _ = self.subscribers.get(id(owner), (None, None))
+            if on_data:
+                on_data(self.data)
+            return
+
+        # A fetch already in flight will fan out to this subscriber too, but it
+        # may predate what owner watches; _on_success checks once it lands
+        if fetch_executor.is_busy(self):
+            self._recheck = max_age if self._recheck is None else min(self._recheck, max_age)
+            return
+
+        if not self.breaker.allow_request():
+            _, on_error = self.subscribers.get(id(owner), (None, None))
+            if on_error:
+                on_error(CircuitOpenError(
+                    f"{self.source} unavailable, retrying in {self.breaker.retry_in():.0f}s"))
+            return
+        self._submit()
+
+    def _submit(self):
+        fetch_executor.submit(self, functools.partial(self.fetch, *self.fetch_args()),
+                              on_success=self._on_success,
+                              on_error=self._on_error)
+
+    def _on_success(self, data):
+        self.breaker.record_success()
+        self.data = data
+        self.fetched_at = time.time()
+        for on_data, _ in list(self.subscribers.values()):
+            on_data(data)
+
+        max_age, self._recheck = self._recheck, None
+        if max_age is not None and not self.is_fresh(max_age) and self.subscribers:
+            # Something was watched after this batch was sent; fetch again for it
+            self._submit()
+
+    def _on_error(self, error):
+        self._recheck = None  # The next scheduled update retries
+        self.breaker.record_failure()
+        for _, on_error in list(self.subscribers.values()):
+            if on_error:
+                on_error(error)
+
+
+class ProviderHub:
+    """Registry of live providers keyed by (source, parameters)"""
+
+    def __init__(self):
+        self._providers = {}
+
+    def get(self, provider_class, *params):
+        """Return the shared provider for these parameters, creating it if needed"""
+        key = (provider_class.source, params)
+        provider = self._providers.get(key)
+        if provider is None:
+            provider = provider_class(*params)
+            self._providers[key] = provider
+        return provider
+
+    def release(self, provider, owner):
+        """Unsubscribe owner and forget the provider once nobody uses it"""
+        provider.unsubscribe(owner)
+        if not provider.subscribers:
+            self._providers.pop(provider.key, None)
+
+    def __len__(self):
+        return len(self._providers)
+
+
+# Shared provider registry used by all widgets
+providers = ProviderHub()
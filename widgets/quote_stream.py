@@ -0,0 +1,214 @@
+# widgets/quote_stream.py
+
+import asyncio
+import json
+import threading
+import time
+import websockets
+from kivy.clock import Clock
+
+
+class QuoteStream:
+    """Live trades from a WebSocket feed, delivered to the UI at a throttled rate.
+
+    A background thread runs an asyncio client that keeps the connection open and
+    re-sends the subscription after reconnecting (with exponential backoff).
+    Incoming trades are folded into a per-symbol "latest" dict, and a Clock event
+    drains it `ui_rate` times a second, so a burst of trades costs one UI update.
+
+    Feed protocol (JSON text frames): the client sends
+    {"action": "subscribe", "symbols": [...]}; the server sends trades as
+    {"symbol", "price", "size", "time"} objects, alone or in a list.
+    """
+
+    def __init__(self, url, ui_rate=4, reconnect_delay=1, max_reconnect_delay=60,
+                 stats_interval=60):
+        self.url = url
+        self.ui_rate = ui_rate
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.stats_interval = stats_interval  # Seconds between traffic reports (0 = off)
+        self.subscribers = {}  # id(owner) -> (symbols, on_ticks)
+        self.connected = False
+
+        self._pending = {}  # symbol -> (time, price, size) folded since the last flush
+        self._lock = threading.Lock()
+        self._thread = None
+        self._loop = None
+        self._ws = None
+        self._stop = None  # threading.Event of the running client thread
+        self._wakeup = None  # asyncio.Event that cuts the client's reconnect backoff short
+        self._flush_event = None
+
+        # Counters for the traffic report
+        self.trades = 0
+        self.bytes_received = 0
+        self.flushes = 0
+        self._stats_started = time.monotonic()
+
+    @property
+    def symbols(self):
+        return sorted(set().union(*(symbols for symbols, _ in list(self.subscribers.values()))))
+
+    def subscribe(self, owner, symbols, on_ticks):
+        """Deliver ticks for `symbols` to on_ticks({symbol: (time, price, size)}) on the UI thread"""
+        self.subscribers[id(owner)] = (tuple(symbols), on_ticks)
+        if self._thread is None:
+            self._start()
+        else:
+            self._send_subscription()
+
+    def unsubscribe(self, owner):
+        self.subscribers.pop(id(owner), None)
+        if not self.subscribers:
+            self.stop()
+        else:
+            self._send_subscription()
+
+    def _start(self):
+        # Each client thread gets its own stop flag, so a restart never revives an old one
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                                        name='quote-stream', daemon=True)
+        self._thread.start()
+        self._flush_event = Clock.schedule_interval(self._flush, 1.0 / self.ui_rate)
+
+    def stop(self):
+        """Close the connection and stop the client thread"""
+        if self._stop is not None:
+            self._stop.set()
+        if self._flush_event is not None:
+            self._flush_event.cancel()
+            self._flush_event = None
+        loop, ws, wakeup = self._loop, self._ws, self._wakeup
+        if loop is not None:
+            try:
+                if ws is not None:
+                    asyncio.run_coroutine_threadsafe(ws.close(), loop)
+                if wakeup is not None:
+                    # Don't leave the client asleep in a reconnect backoff
+                    loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # The client's loop has already finished
+        self._thread = None
+        self.connected = False
+
+    def _run(self, stop):
+        asyncio.run(self._listen(stop))
+
+    async def _listen(self, stop):
+        """Connect, subscribe and read trades until stopped (client thread)"""
+        self._loop = loop = asyncio.get_running_loop()
+        self._wakeup = wakeup = asyncio.Event()
+        delay = self.reconnect_delay
+        try:
+            while not stop.is_set():
+                try:
+                    async with websockets.connect(self.url, open_timeout=10) as ws:
+                        if stop.is_set():
+                            break
+                        self._ws = ws
+                        self.connected = True
+                        delay = self.reconnect_delay
+                        print(f"[QuoteStream] Connected to {self.url}")
+                        await ws.send(self._subscription())
+                        async for message in ws:
+                            self._on_message(message)
+                except Exception as e:
+                    if not stop.is_set():
+                        print(f"[QuoteStream] Connection to {self.url} failed: {e}")
+                finally:
+                    if not stop.is_set():
+                        self._ws = None
+                        self.connected = False
+
+                if not stop.is_set():
+                    # Sleep through the backoff, unless stop() wakes us first
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    delay = min(self.max_reconnect_delay, delay * 2)
+        finally:
+            if self._loop is loop:
+                # Unless a restarted client has already replaced them
+                self._loop = None
+                self._ws = None
+                self._wakeup = None
+
+    def _subscription(self):
+        return json.dumps({'action': 'subscribe', 'symbols': self.symbols})
+
+    def _send_subscription(self):
+        if self._loop is not None and self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._ws.send(self._subscription()), self._loop)
+
+    def _on_message(self, message):
+        """Fold trades into the pending dict (client thread)"""
+        self.bytes_received += len(message)
+        try:
+            trades = json.loads(message)
+        except ValueError:
+            return
+        if isinstance(trades, dict):
+            trades = [trades]
+
+        with self._lock:
+            for trade in trades:
+                symbol = trade.get('symbol')
+                price = trade.get('price')
+                if symbol is None or price is None:
+                    continue
+                size = trade.get('size', 0)
+                pending = self._pending.get(symbol)
+                if pending is not None:
+                    size += pending[2]
+                self._pending[symbol] = (trade.get('time', time.time()), float(price), size)
+                self.trades += 1
+
+    def _flush(self, dt):
+        """Hand the trades folded since the last flush to subscribers (UI thread)"""
+        with self._lock:
+            ticks, self._pending = self._pending, {}
+        if ticks:
+            self.flushes += 1
+            for symbols, on_ticks in list(self.subscribers.values()):
+                wanted = {symbol: ticks[symbol] for symbol in symbols if symbol in ticks}
+                if wanted:
+                    on_ticks(wanted)
+        self._report()
+
+    def _report(self):
+        elapsed = time.monotonic() - self._stats_started
+        if not self.stats_interval or elapsed < self.stats_interval:
+            return
+        print(f"[QuoteStream] {self.trades} trades, {self.bytes_received / 1024:.1f} KB, "
+              f"{self.flushes} UI updates in the last {elapsed:.0f}s")
+        self.trades = 0
+        self.bytes_received = 0
+        self.flushes = 0
+        self._stats_started = time.monotonic()
+
+
+class StreamHub:
+    """One shared QuoteStream per feed URL"""
+
+    def __init__(self):
+        self._streams = {}
+
+    def get(self, url, **settings):
+        stream = self._streams.get(url)
+        if stream is None:
+            stream = QuoteStream(url, **settings)
+            self._streams[url] = stream
+        return stream
+
+    def release(self, stream, owner):
+        """Unsubscribe owner and forget the stream once nobody uses it"""
+        stream.unsubscribe(owner)
+        if not stream.subscribers:
+            self._streams.pop(stream.url, None)
+
+
+# Shared quote streams used by the finance widgets
+streams = StreamHub()
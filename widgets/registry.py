@@ -0,0 +1,89 @@
+# widgets/registry.py
+
+import importlib
+import time
+
+# widget type -> (module, class name, default constructor kwargs)
+# Modules are only imported when a configured slot needs them, so heavy
+# dependencies (yfinance, pandas, matplotlib, openmeteo) stay out of boot
+# unless a widget actually uses them.
+WIDGET_PLUGINS = {
+    'weather': ('widgets.weather', 'WeatherWidget', {}),
+    'system_monitor': ('widgets.system_monitor', 'SystemMonitorWidget', {}),
+    'quote': ('widgets.quote', 'QuoteWidget', {}),
+    'finance': ('widgets.finance', 'FinanceWidget', {'symbol': 'QQQ'}),
+    'watchlist': ('widgets.finance', 'WatchlistWidget', {}),
+    'news': ('widgets.news', 'NewsWidget', {}),
+    'calendar': ('widgets.calendar_widget', 'CalendarWidget', {}),
+}
+
+
+class WidgetRegistry:
+    """Lazily imports and instantiates dashboard widget plugins"""
+
+    def __init__(self, plugins=None):
+        self.plugins = dict(WIDGET_PLUGINS if plugins is None else plugins)
+        self.import_times = {}  # widget type -> seconds spent importing its module
+        self._classes = {}
+
+    def register(self, widget_type, module_name, class_name, **defaults):
+        """Add (or replace) a widget plugin"""
+        self.plugins[widget_type] = (module_name, class_name, defaults)
+        self._classes.pop(widget_type, None)
+
+    def widget_types(self):
+        return list(self.plugins)
+
+    def is_loaded(self, widget_type):
+        return widget_type in self._classes
+
+    def get_class(self, widget_type):
+        """Return the widget class, importing its module on first use"""
+        if widget_type in self._classes:
+            return self._classes[widget_type]
+
+        plugin = self.plugins.get(widget_type)
+        if plugin is None:
+            return None
+
+        module_name, class_name, _ = plugin
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self.import_times[widget_type] = time.perf_counter() - start
+
+        widget_class = getattr(module, class_name)
+        self._classes[widget_type] = widget_class
+        return widget_class
+
+    def create(self, widget_type, **kwargs):
+        """Create a widget instance, or None for unknown or broken plugins"""
+        try:
+            widget_class = self.get_class(widget_type)
+        except Exception as e:
+            print(f"Failed to load {widget_type} widget: {e}")
+            return None
+        if widget_class is None:
+            return None
+
+        _, _, defaults = self.plugins[widget_type]
+        options = dict(defaults)
+        options.update(kwargs)
+        try:
+            return widget_class(**options)
+        except Exception as e:
+            # e.g. a typo in the tile's options in dashboard_config.json
+            print(f"Failed to create {widget_type} widget: {e}")
+            return None
+
+    def report(self):
+        """Print the import cost of each plugin loaded so far"""
+        print("[WidgetRegistry] Plugin import cost:")
+        # Modules shared between plugins are charged to whichever imported them first
+        for widget_type, seconds in sorted(self.import_times.items(), key=lambda item: -item[1]):
+            print(f"  {widget_type:<15} {seconds * 1000:8.1f} ms")
+        total = sum(self.import_times.values())
+        print(f"  {'total':<15} {total * 1000:8.1f} ms")
+
+        skipped = [t for t in self.plugins if not self.is_loaded(t)]
+        if skipped:
+            print(f"  not loaded: {', '.join(skipped)}")
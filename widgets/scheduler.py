@@ -0,0 +1,157 @@
+# widgets/scheduler.py
+
+import functools
+import heapq
+import itertools
+import time
+from kivy.clock import Clock
+
+
+class ScheduledUpdate:
+    """One widget registered with the scheduler"""
+
+    def __init__(self, key, target, interval, callback):
+        self.key = key
+        self.target = target
+        self.interval = interval
+        self.callback = callback
+        self.due = 0
+        self.active = True
+        self.exact = False  # Due time is a hard boundary (e.g. market open), never run early
+
+
+class UpdateScheduler:
+    """Single-timer scheduler for all periodic widget updates.
+
+    Entries live in a min-heap ordered by next due time. The scheduler keeps one
+    Clock event armed for the earliest entry, and when it wakes it also runs any
+    entry due within a small slack window, so nearby updates share one wake-up.
+
+    Targets with their own cache throttle (a last_update attribute) are updated
+    with update(force=True): the scheduler has already decided they are due,
+    and last_update keeps recording when their data actually arrived.
+
+    A target may define next_update_in() to choose its own delay after each run
+    (None keeps the regular interval); the finance widgets use it to sleep
+    through market closures.
+    """
+
+    def __init__(self, intervals, coalesce_window=2.0):
+        self.intervals = intervals
+        self.coalesce_window = coalesce_window
+        self._heap = []
+        self._entries = {}  # id(target) -> ScheduledUpdate
+        self._counter = itertools.count()  # Tie-breaker so the heap never compares entries
+        self._event = None
+        self._event_due = None
+
+        # Counters for profiling
+        self.wakeups = 0
+        self.runs = 0
+
+    def add(self, key, target, callback=None, delay=None, interval=None):
+        """Schedule target.update() (or callback) every intervals[key] seconds"""
+        if interval is None:
+            interval = self.intervals.get(key)
+        if not interval:
+            return None
+
+        self.remove(target)
+        if callback is None:
+            # The scheduler decides when a widget is due, so bypass the widget's own throttle
+            callback = (functools.partial(target.update, force=True)
+                        if hasattr(target, 'last_update') else target.update)
+        entry = ScheduledUpdate(key, target, interval, callback)
+        entry.due = time.monotonic() + (interval if delay is None else delay)
+        self._entries[id(target)] = entry
+        self._push(entry)
+        self._rearm()
+        return entry
+
+    def remove(self, target):
+        """Stop updating target; its heap slot is discarded lazily"""
+        entry = self._entries.pop(id(target), None)
+        if entry:
+            entry.active = False
+
+    def clear(self):
+        for entry in self._entries.values():
+            entry.active = False
+        self._entries = {}
+        self._heap = []
+        self._cancel_event()
+
+    def _push(self, entry):
+        heapq.heappush(self._heap, (entry.due, next(self._counter), entry))
+
+    def _slack(self, entry):
+        if entry.exact:
+            return 0
+        # Never pull a short-interval update (the clock) noticeably early
+        return min(self.coalesce_window, entry.interval * 0.1)
+
+    def _next_due(self, entry, due, now):
+        next_update_in = getattr(entry.target, 'next_update_in', None)
+        delay = next_update_in() if next_update_in else None
+        if delay is not None and delay != entry.interval:
+            entry.exact = True
+            return now + delay
+
+        entry.exact = False
+        # Keep the original cadence, but don't replay missed runs in a burst
+        next_due = due + entry.interval
+        if next_due <= now:
+            next_due = now + entry.interval
+        return next_due
+
+    def _cancel_event(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+            self._event_due = None
+
+    def _rearm(self):
+        """Arm a single Clock event for the earliest active entry"""
+        while self._heap and not self._heap[0][2].active:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._cancel_event()
+            return
+
+        due = self._heap[0][0]
+        if self._event is not None and self._event_due == due:
+            return
+
+        self._cancel_event()
+        self._event_due = due
+        self._event = Clock.schedule_once(self._wake, max(0, due - time.monotonic()))
+
+    def _wake(self, dt):
+        self._event = None
+        self._event_due = None
+        self.wakeups += 1
+        now = time.monotonic()
+
+        while self._heap:
+            due, _, entry = self._heap[0]
+            if not entry.active:
+                heapq.heappop(self._heap)
+                continue
+            if due > now + self._slack(entry):
+                break
+
+            heapq.heappop(self._heap)
+            self._run(entry)
+
+            entry.due = self._next_due(entry, due, now)
+            if entry.active:
+                self._push(entry)
+
+        self._rearm()
+
+    def _run(self, entry):
+        self.runs += 1
+        try:
+            entry.callback()
+        except Exception as e:
+            print(f"Scheduled {entry.key} update failed: {e}")
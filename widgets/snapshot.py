@@ -0,0 +1,87 @@
+# widgets/snapshot.py
+
+import json
+import os
+import time
+
+SNAPSHOT_FILE = "dashboard_state.json"
+
+
+def format_age(seconds):
+    """Short human-readable age, e.g. '45s', '12m', '3h', '2d'"""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+
+class StateSnapshot:
+    """Persists each widget's last good payload so restarts paint instantly.
+
+    Widgets opt in by implementing get_snapshot() -> JSON-serializable data (or None)
+    and restore_snapshot(data, fetched_at). Entries are keyed by grid slot and type.
+    """
+
+    def __init__(self, path=SNAPSHOT_FILE):
+        self.path = path
+        self.entries = self._load()
+        self._last_written = None
+
+    @staticmethod
+    def slot_key(position, widget_type):
+        return f"{position}:{widget_type}"
+
+    def _load(self):
+        """Load snapshot entries from disk"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading state snapshot: {e}")
+        return {}
+
+    def restore(self, key, widget):
+        """Hand a saved payload back to a freshly created widget"""
+        entry = self.entries.get(key)
+        if not entry or not hasattr(widget, 'restore_snapshot'):
+            return False
+        try:
+            widget.restore_snapshot(entry['data'], entry['fetched_at'])
+            return True
+        except Exception as e:
+            print(f"Error restoring {key} from snapshot: {e}")
+            return False
+
+    def capture(self, key, widget):
+        """Record a widget's current payload (in memory only)"""
+        if not hasattr(widget, 'get_snapshot'):
+            return
+        try:
+            data = widget.get_snapshot()
+        except Exception as e:
+            print(f"Error capturing {key} snapshot: {e}")
+            return
+        if data is not None:
+            self.entries[key] = {
+                'fetched_at': getattr(widget, 'last_update', 0) or time.time(),
+                'data': data
+            }
+
+    def save(self):
+        """Write the snapshot atomically, skipping the write if nothing changed"""
+        try:
+            payload = json.dumps(self.entries, separators=(',', ':'))
+            if payload == self._last_written:
+                return
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+            self._last_written = payload
+        except Exception as e:
+            print(f"Error saving state snapshot: {e}")
@@ -0,0 +1,147 @@
+# widgets/sparkline.py
+
+from kivy.graphics import Color, Line, Mesh
+from kivy.uix.widget import Widget
+import numpy as np
+
+
+def lttb_indices(x, y, threshold):
+    """Indices of `threshold` points chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the
+    average of the next bucket, which preserves peaks and dips of the series.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets covering the points between the first and last
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Twice the triangle area for every candidate in the bucket at once
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+class SparklineChart(Widget):
+    """Lightweight price chart drawn directly with Kivy graphics.
+
+    The series is downsampled with LTTB to about one point per horizontal pixel
+    and drawn as a Line over a translucent Mesh fill, with optional indicator
+    lines on the same scale. No matplotlib involved.
+    """
+
+    UP_COLOR = (0.2, 0.8, 0.3)
+    DOWN_COLOR = (0.9, 0.25, 0.25)
+    OVERLAY_COLORS = ((0.3, 0.6, 1.0), (1.0, 0.65, 0.2), (0.8, 0.45, 0.9), (0.6, 0.6, 0.6))
+
+    def __init__(self, title='', theme='light', line_width=1.5, padding=4, **kwargs):
+        super().__init__(**kwargs)
+        self.title = title  # Unused; the finance label already names the symbol
+        self.theme = theme  # Unused; drawn straight onto the tile's own background
+        self.padding = padding
+        self.times = None
+        self.close = None
+        self.overlays = {}  # Indicator name -> values aligned with times
+        self.overlay_lines = {}  # Indicator name -> Line
+        self.chart_key = None  # Identifies the series currently drawn
+
+        with self.canvas:
+            self.fill_color = Color(*self.UP_COLOR, 0.2)
+            self.fill = Mesh(mode='triangle_strip')
+            self.line_color = Color(*self.UP_COLOR, 1)
+            self.line = Line(width=line_width)
+
+        self.bind(pos=self._redraw, size=self._redraw)
+
+    def set_series(self, times, close, overlays=None):
+        """Show a new series (epoch seconds, prices, indicator lines); False if nothing changed"""
+        if len(close) == 0:
+            return False
+        overlays = overlays or {}
+        key = (len(close), times[0], times[-1], close.tobytes(),
+               tuple((name, values.tobytes()) for name, values in overlays.items()))
+        if key == self.chart_key:
+            return False
+
+        self.times = np.asarray(times, dtype=float)
+        self.close = np.asarray(close, dtype=float)
+        # Copy: the indicator arrays are updated in place later
+        self.overlays = {name: np.array(values, dtype=float) for name, values in overlays.items()}
+        for name in self.overlays:
+            if name not in self.overlay_lines:
+                color = self.OVERLAY_COLORS[len(self.overlay_lines) % len(self.OVERLAY_COLORS)]
+                with self.canvas:
+                    Color(*color, 0.9)
+                    self.overlay_lines[name] = Line(width=1)
+        self.chart_key = key
+
+        color = self.UP_COLOR if close[-1] >= close[0] else self.DOWN_COLOR
+        self.line_color.rgba = (*color, 1)
+        self.fill_color.rgba = (*color, 0.2)
+        self._redraw()
+        return True
+
+    def _redraw(self, *args):
+        """Fit the downsampled series to the widget's current size"""
+        if self.close is None or len(self.close) < 2 or self.width < 2:
+            self.line.points = []
+            self.fill.vertices = []
+            self.fill.indices = []
+            for line in self.overlay_lines.values():
+                line.points = []
+            return
+
+        # No point drawing more vertices than there are pixel columns
+        idx = lttb_indices(self.times, self.close, max(3, int(self.width)))
+        x = self.times[idx]
+        y = self.close[idx]
+
+        overlays = {name: values[idx] for name, values in self.overlays.items()}
+        pad = self.padding
+        span_x = (x[-1] - x[0]) or 1.0
+        low, high = y.min(), y.max()
+        for values in overlays.values():
+            if np.isfinite(values).any():
+                low, high = min(low, np.nanmin(values)), max(high, np.nanmax(values))
+        span_y = (high - low) or 1.0
+        xs = self.x + pad + (x - x[0]) / span_x * (self.width - 2 * pad)
+        ys = self.y + pad + (y - low) / span_y * (self.height - 2 * pad)
+
+        self.line.points = np.column_stack((xs, ys)).ravel().tolist()
+
+        # Triangle strip alternating between the baseline and the line: x, y, u, v
+        vertices = np.zeros((len(xs) * 2, 4))
+        vertices[0::2, 0] = xs
+        vertices[0::2, 1] = self.y
+        vertices[1::2, 0] = xs
+        vertices[1::2, 1] = ys
+        self.fill.vertices = vertices.ravel().tolist()
+        self.fill.indices = list(range(len(xs) * 2))
+
+        for name, line in self.overlay_lines.items():
+            values = overlays.get(name)
+            if values is None:
+                line.points = []
+                continue
+            # Indicators start after a warm-up window; leave those bars out
+            valid = np.isfinite(values)
+            ys = self.y + pad + (values[valid] - low) / span_y * (self.height - 2 * pad)
+            line.points = np.column_stack((xs[valid], ys)).ravel().tolist()
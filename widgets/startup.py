@@ -0,0 +1,130 @@
+# widgets/startup.py
+
+import random
+import time
+from kivy.clock import Clock
+
+# Widgets that only read local state; cheap enough to update on the first frame
+LOCAL_WIDGET_TYPES = ('clock', 'calendar', 'quote', 'system_monitor')
+
+# Order in which network widgets are started (lower first)
+NETWORK_PRIORITY = {
+    'weather': 0,
+    'finance': 1,
+    'watchlist': 1,
+    'news': 2,
+}
+
+
+class StartupPipeline:
+    """Runs the initial widget updates after the window is shown.
+
+    Local widgets update immediately; network widgets are spread over the first
+    few seconds (with jitter) so their fetches don't all land at once. Records
+    time-to-first-paint and time-to-fully-populated for every widget.
+    """
+
+    def __init__(self, network_spread=5.0, jitter=1.0, report_timeout=60):
+        self.network_spread = network_spread
+        self.jitter = jitter
+        self.report_timeout = report_timeout
+        self.started_at = time.monotonic()
+        self.timings = {}  # label -> {'first_paint': seconds, 'populated': seconds}
+        self._pending = {}  # label -> widget still waiting for fresh data
+        self._unstarted = 0
+        self._events = []
+        self._poll_event = None
+
+    def run(self, entries, start_widget, started_at=None):
+        """Start every (label, widget_type, widget) entry via start_widget(widget).
+
+        Timings are measured from started_at (a time.monotonic() value), or from now.
+        """
+        self.cancel()
+        self.timings = {}
+        self.started_at = time.monotonic() if started_at is None else started_at
+
+        local = [e for e in entries if e[1] in LOCAL_WIDGET_TYPES]
+        network = [e for e in entries if e[1] not in LOCAL_WIDGET_TYPES]
+        network.sort(key=lambda e: NETWORK_PRIORITY.get(e[1], len(NETWORK_PRIORITY)))
+
+        for entry in local:
+            self._start(entry, start_widget)
+
+        # Evenly spaced slots across the spread window, each nudged by random jitter
+        step = self.network_spread / len(network) if network else 0
+        self._unstarted = len(network)
+        for i, entry in enumerate(network):
+            delay = i * step + random.uniform(0, self.jitter)
+            event = Clock.schedule_once(lambda dt, e=entry: self._start(e, start_widget), delay)
+            self._events.append(event)
+
+        self._poll_event = Clock.schedule_interval(self._poll_populated, 0.25)
+
+    def cancel(self):
+        for event in self._events:
+            event.cancel()
+        self._events = []
+        if self._poll_event is not None:
+            self._poll_event.cancel()
+            self._poll_event = None
+        self._pending = {}
+        self._unstarted = 0
+
+    def _elapsed(self):
+        return time.monotonic() - self.started_at
+
+    def _start(self, entry, start_widget):
+        label, widget_type, widget = entry
+        if widget_type not in LOCAL_WIDGET_TYPES:
+            self._unstarted -= 1
+        try:
+            start_widget(widget)
+        except Exception as e:
+            print(f"Initial {widget_type} update failed: {e}")
+
+        self.timings[label] = {'first_paint': None, 'populated': None}
+        # The widget is painted on the frame after its first update
+        Clock.schedule_once(lambda dt: self._mark(label, 'first_paint'), 0)
+
+        if hasattr(widget, 'cached_data') and not self._is_populated(widget):
+            self._pending[label] = widget
+        else:
+            self._mark(label, 'populated')
+
+    def _mark(self, label, stage):
+        timing = self.timings.get(label)
+        if timing is not None and timing[stage] is None:
+            timing[stage] = self._elapsed()
+
+    @staticmethod
+    def _is_populated(widget):
+        """True once the widget shows fresh data, fetched or restored"""
+        if widget.cached_data is None:
+            return False
+        if not getattr(widget, 'stale', False):
+            return True
+        # Restored from a snapshot recent enough that the widget won't refetch yet
+        age = time.time() - getattr(widget, 'last_update', 0)
+        return age < getattr(widget, 'update_interval', 0)
+
+    def _poll_populated(self, dt):
+        for label, widget in list(self._pending.items()):
+            if self._is_populated(widget):
+                self._mark(label, 'populated')
+                del self._pending[label]
+
+        if (not self._pending and self._unstarted <= 0) or self._elapsed() > self.report_timeout:
+            self._poll_event.cancel()
+            self._poll_event = None
+            self.report()
+
+    def report(self):
+        """Print startup timings per widget"""
+        print("[Startup] Widget timings (seconds since launch):")
+        for label, timing in self.timings.items():
+            paint = timing['first_paint']
+            populated = timing['populated']
+            paint_text = f"{paint:6.2f}" if paint is not None else "     -"
+            populated_text = f"{populated:6.2f}" if populated is not None else "not yet"
+            print(f"  {label:<20} first paint {paint_text}  populated {populated_text}")
@@ -2,6 +2,8 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 import psutil
 import time
+from widgets.fetch_executor import fetch_executor
+from widgets.snapshot import format_age
 
 class SystemMonitorWidget(BoxLayout):
     def __init__(self, **kwargs):
@@ -27,12 +29,13 @@ class SystemMonitorWidget(BoxLayout):
         self.cached_data = None
         self.update_interval = 10  # 10 seconds
         self.first_update = True  # Flag for first update
+        self.stale = False  # True while showing data restored from a snapshot
 
     def render(self, parent):
         parent.add_widget(self)
         self.update()
 
-    def update(self):
+    def update(self, force=False):
         current_time = time.time()
         
         # Skip cache check on first update or if forced
@@ -41,57 +44,88 @@ class SystemMonitorWidget(BoxLayout):
             self.last_update = 0  # Force update
         
         # Only update if enough time has passed
-        if current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
+        if not force and current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
             return
             
+        # cpu_percent(interval=0.1) blocks, so sample on the fetch executor
+        if fetch_executor.is_busy(self):
+            return
+
+        fetch_executor.submit(self, self._sample_stats,
+                              on_success=self._apply_stats,
+                              on_error=self._on_sample_error)
+
+    def _sample_stats(self):
+        """Read system stats (runs on a worker thread)"""
+        # CPU usage (with shorter interval for more accurate reading)
+        cpu_percent = psutil.cpu_percent(interval=0.1)
+        
+        # Memory usage
+        memory = psutil.virtual_memory()
+        memory_percent = memory.percent
+        memory_gb = memory.used / (1024**3)
+        
+        # Disk usage
+        disk = psutil.disk_usage('/')
+        disk_percent = disk.percent
+        disk_gb = disk.used / (1024**3)
+        
+        # CPU temperature (Raspberry Pi specific)
+        temp_text = "Temp: N/A"
         try:
-            # CPU usage (with shorter interval for more accurate reading)
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_gb = memory.used / (1024**3)
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = disk.percent
-            disk_gb = disk.used / (1024**3)
-            
-            # CPU temperature (Raspberry Pi specific)
-            temp_text = "Temp: N/A"
-            try:
-                with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                    temp_celsius = float(f.read()) / 1000
-                    temp_fahrenheit = temp_celsius * 9/5 + 32
-                    temp_text = f"Temp: {temp_fahrenheit:.1f}°F"
-            except:
-                pass
-            
-            # Cache the data
-            self.cached_data = {
-                'cpu': cpu_percent,
-                'memory': (memory_percent, memory_gb),
-                'disk': (disk_percent, disk_gb),
-                'temp': temp_text
-            }
-            self.last_update = current_time
-            
-            # Update labels
-            self.cpu_label.text = f"CPU: {cpu_percent:.1f}%"
-            self.memory_label.text = f"RAM: {memory_percent:.1f}% ({memory_gb:.1f}GB)"
-            self.disk_label.text = f"Disk: {disk_percent:.1f}% ({disk_gb:.1f}GB)"
-            self.temp_label.text = temp_text
-                
-        except Exception as e:
-            print(f"System monitor update failed: {e}")
-            # Use cached data if available
-            if self.cached_data:
-                self.cpu_label.text = f"CPU: {self.cached_data['cpu']:.1f}%"
-                mem_pct, mem_gb = self.cached_data['memory']
-                self.memory_label.text = f"RAM: {mem_pct:.1f}% ({mem_gb:.1f}GB)"
-                disk_pct, disk_gb = self.cached_data['disk']
-                self.disk_label.text = f"Disk: {disk_pct:.1f}% ({disk_gb:.1f}GB)"
-                self.temp_label.text = self.cached_data['temp']
-            else:
-                self.cpu_label.text = f"Error: {e}" 
\ No newline at end of file
+            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
+                temp_celsius = float(f.read()) / 1000
+                temp_fahrenheit = temp_celsius * 9/5 + 32
+                temp_text = f"Temp: {temp_fahrenheit:.1f}°F"
+        except:
+            pass
+
+        return {
+            'cpu': cpu_percent,
+            'memory': (memory_percent, memory_gb),
+            'disk': (disk_percent, disk_gb),
+            'temp': temp_text
+        }
+
+    def _apply_stats(self, stats):
+        """Show freshly sampled stats (UI thread)"""
+        # Cache the data
+        self.cached_data = stats
+        self.last_update = time.time()
+        self.stale = False
+        self._show_stats(stats)
+
+    def _show_stats(self, stats):
+        self.cpu_label.text = f"CPU: {stats['cpu']:.1f}%"
+        mem_pct, mem_gb = stats['memory']
+        self.memory_label.text = f"RAM: {mem_pct:.1f}% ({mem_gb:.1f}GB)"
+        disk_pct, disk_gb = stats['disk']
+        self.disk_label.text = f"Disk: {disk_pct:.1f}% ({disk_gb:.1f}GB)"
+        self.temp_label.text = stats['temp']
+        if self.stale:
+            self.cpu_label.text += f" (cached {format_age(time.time() - self.last_update)} ago)"
+
+    def _on_sample_error(self, e):
+        print(f"System monitor update failed: {e}")
+        # Use cached data if available
+        if self.cached_data:
+            self._show_stats(self.cached_data)
+        else:
+            self.cpu_label.text = f"Error: {e}"
+
+    def get_snapshot(self):
+        """Last good stats for the warm-start snapshot"""
+        return self.cached_data
+
+    def restore_snapshot(self, data, fetched_at):
+        """Show saved stats until the first fresh sample"""
+        self.cached_data = {
+            'cpu': data['cpu'],
+            'memory': tuple(data['memory']),
+            'disk': tuple(data['disk']),
+            'temp': data['temp']
+        }
+        self.last_update = fetched_at
+        self.first_update = False
+        self.stale = True
+        self._show_stats(self.cached_data)
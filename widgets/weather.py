@@ -1,40 +1,174 @@
 from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 import openmeteo_requests
-import requests_cache
-from retry_requests import retry
 import time
-
-# Setup Open-Meteo API client with longer cache
-cache_session = requests_cache.CachedSession('.cache', expire_after=1800)  # 30 minutes cache
-retry_session = retry(cache_session, retries=3, backoff_factor=0.2)
-openmeteo = openmeteo_requests.Client(session=retry_session)
+from widgets.forecast_strip import ForecastStrip
+from widgets.http_cache import http_cache
+from widgets.providers import DataProvider, providers
+from widgets.snapshot import format_age
 
 url = "https://api.open-meteo.com/v1/forecast"
-params = {
-    "latitude": 42.36,  # Boston
-    "longitude": -71.06,
-    "current": ["temperature_2m", "relative_humidity_2m", "apparent_temperature", "wind_speed_10m", "precipitation"]
-}
+current_variables = ["temperature_2m", "relative_humidity_2m", "apparent_temperature", "wind_speed_10m", "precipitation"]
+# Only requested while some widget shows a forecast strip
+hourly_variables = ["temperature_2m", "precipitation"]
+daily_variables = ["temperature_2m_max", "temperature_2m_min"]
+FORECAST_DAYS = 7
+
+# Default location when a widget has no "options" in dashboard_config.json
+DEFAULT_LATITUDE = 42.36  # Boston
+DEFAULT_LONGITUDE = -71.06
+
+
+class OpenMeteoProvider(DataProvider):
+    """Current conditions for every shown location, fetched in one batched call.
+
+    Widgets register their coordinates with watch(). A fetch sends all distinct
+    locations to Open-Meteo as comma-separated latitude/longitude lists, which
+    returns one response per location in request order, so any number of
+    weather widgets costs one HTTP request per interval.
+
+    While any widget shows a forecast, the same request also asks for hourly
+    and daily values. Those are handed on as the NumPy views ValuesAsNumpy()
+    returns over the FlatBuffers response, without copying.
+    """
+
+    source = 'open-meteo'
+
+    def __init__(self, *params):
+        super().__init__(*params)
+        self.watchers = {}  # id(owner) -> (latitude, longitude)
+        self.forecast_watchers = set()  # id(owner) of widgets showing a forecast
+        self.client = None  # Created on the first fetch, not at import
+
+    @property
+    def locations(self):
+        return sorted(set(self.watchers.values()))
+
+    def watch(self, owner, latitude, longitude, on_data, on_error=None, forecast=False):
+        """Subscribe owner to the conditions (and optionally forecast) at (latitude, longitude)"""
+        self.watchers[id(owner)] = (latitude, longitude)
+        if forecast:
+            self.forecast_watchers.add(id(owner))
+        self.subscribe(owner, on_data, on_error)
+
+    def unsubscribe(self, owner):
+        self.watchers.pop(id(owner), None)
+        self.forecast_watchers.discard(id(owner))
+        super().unsubscribe(owner)
+
+    def is_fresh(self, max_age):
+        # A newly watched location (or forecast) isn't in the last batch yet
+        if not super().is_fresh(max_age):
+            return False
+        if self.forecast_watchers and not all('forecast' in data for data in self.data.values()):
+            return False
+        return all(loc in self.data for loc in self.locations)
+
+    def _get_client(self):
+        if self.client is None:
+            # Responses are cached for weather_cache seconds (cache_settings in performance_config.json).
+            # No retry wrapper: failures are handled by the provider's circuit breaker
+            self.client = openmeteo_requests.Client(session=http_cache.session('weather'))
+        return self.client
+
+    def fetch_args(self):
+        """Locations to fetch and whether to include the forecast (UI thread)"""
+        return self.locations, bool(self.forecast_watchers)
+
+    def fetch(self, locations, with_forecast):
+        """Fetch current conditions for `locations` (runs on a worker thread).
+
+        Returns {(latitude, longitude): conditions}.
+        """
+        if not locations:
+            return {}
+        params = {
+            "latitude": ",".join(str(latitude) for latitude, _ in locations),
+            "longitude": ",".join(str(longitude) for _, longitude in locations),
+            "current": current_variables
+        }
+        if with_forecast:
+            params.update({
+                "hourly": hourly_variables,
+                "daily": daily_variables,
+                "forecast_days": FORECAST_DAYS,
+                "timezone": "auto"  # Daily values run midnight to midnight locally
+            })
+        responses = self._get_client().weather_api(url, params=params)
+        if len(responses) != len(locations):
+            raise ValueError(f"Expected {len(locations)} locations, got {len(responses)}")
+
+        conditions = {}
+        for location, response in zip(locations, responses):
+            current = response.Current()
+            conditions[location] = {
+                'temp': current.Variables(0).Value()*9/5+32,
+                'humidity': current.Variables(1).Value(),
+                'apparent_temp': current.Variables(2).Value(),
+                'wind_speed': current.Variables(3).Value(),
+                'precipitation': current.Variables(4).Value()
+            }
+            if with_forecast:
+                conditions[location]['forecast'] = self._forecast(response)
+        return conditions
+
+    @staticmethod
+    def _forecast(response):
+        """Hourly and daily arrays (zero-copy views of the response) with their timing"""
+        hourly = response.Hourly()
+        daily = response.Daily()
+        return {
+            'hourly_start': hourly.Time(),
+            'hourly_interval': hourly.Interval(),
+            'hourly_temp': hourly.Variables(0).ValuesAsNumpy(),
+            'hourly_precip': hourly.Variables(1).ValuesAsNumpy(),
+            'daily_start': daily.Time(),
+            'daily_interval': daily.Interval(),
+            'daily_high': daily.Variables(0).ValuesAsNumpy(),
+            'daily_low': daily.Variables(1).ValuesAsNumpy(),
+            'utc_offset': response.UtcOffsetSeconds(),
+        }
+
 
 class WeatherWidget(BoxLayout):
-    def __init__(self, **kwargs):
+    def __init__(self, latitude=DEFAULT_LATITUDE, longitude=DEFAULT_LONGITUDE, name=None,
+                 forecast=False, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
+        self.latitude = latitude
+        self.longitude = longitude
+        self.name = name
         self.label = Label(text="Loading weather...", font_size='14sp')
         self.add_widget(self.label)
+
+        # Optional 24-hour / 7-day strip under the current conditions
+        self.forecast_strip = None
+        if forecast:
+            self.label.size_hint_y = 0.3
+            self.forecast_strip = ForecastStrip()
+            self.add_widget(self.forecast_strip)
         
         # Cache for weather data
         self.last_update = 0
         self.cached_data = None
         self.update_interval = 300  # 5 minutes
         self.first_update = True  # Flag for first update
+        self.stale = False  # True while showing data restored from a snapshot
+
+        # All weather widgets share one provider (and one batched request)
+        self.provider = providers.get(OpenMeteoProvider)
+        self.provider.watch(self, latitude, longitude, self._apply_weather, self._on_fetch_error,
+                            forecast=forecast)
+
+    def release(self):
+        """Stop receiving data when the widget is removed from the dashboard"""
+        providers.release(self.provider, self)
 
     def render(self, parent):
         parent.add_widget(self)
         self.update()
 
-    def update(self):
+    def update(self, force=False):
         current_time = time.time()
         
         # Skip cache check on first update or if forced
@@ -43,35 +177,62 @@ class WeatherWidget(BoxLayout):
             self.last_update = 0  # Force update
         
         # Only update if enough time has passed
-        if current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
+        if not force and current_time - self.last_update < self.update_interval and self.cached_data and not self.first_update:
             return
         
-        try:
-            responses = openmeteo.weather_api(url, params=params)
-            response = responses[0]
-            current = response.Current()
+        # Reuse a reading another widget fetched within the last half interval
+        self.provider.request(self, max_age=self.update_interval / 2)
 
-            temp = current.Variables(0).Value()*9/5+32
-            humidity = current.Variables(1).Value()
-            apparent_temp = current.Variables(2).Value()
-            wind_speed = current.Variables(3).Value()
-            precipitation = current.Variables(4).Value()
-
-            # Cache the data
-            self.cached_data = {
-                'temp': temp,
-                'humidity': humidity,
-                'wind_speed': wind_speed,
-                'precipitation': precipitation
-            }
-            self.last_update = current_time
+    def _apply_weather(self, conditions):
+        """Show freshly fetched weather (UI thread)"""
+        data = conditions.get((self.latitude, self.longitude))
+        if data is None:
+            return  # Batch sent before this widget's location was watched; a refetch follows
+
+        # Cache the data
+        self.cached_data = {
+            'temp': data['temp'],
+            'humidity': data['humidity'],
+            'wind_speed': data['wind_speed'],
+            'precipitation': data['precipitation']
+        }
+        self.last_update = time.time()
+        self.stale = False
+
+        self._show_weather(self.cached_data)
+        if self.forecast_strip is not None and 'forecast' in data:
+            self.forecast_strip.set_forecast(data['forecast'])
 
-            self.label.text = f'{temp:.1f}°F and {humidity}% humidity'
+    def _show_weather(self, data, age=None):
+        text = f'{data["temp"]:.1f}°F and {data["humidity"]}% humidity'
+        if self.name:
+            text = f'{self.name}: {text}'
+        if age is not None:
+            text += f'\n(cached {format_age(age)} ago)'
+        self.label.text = text
+
+    def _on_fetch_error(self, e):
+        print("Weather update failed:", e)
+        # Use cached data if available, marked with its age
+        if self.cached_data:
+            self._show_weather(self.cached_data, age=time.time() - self.last_update)
+        else:
+            self.label.text = f"Error: {e}"
+
+    def get_snapshot(self):
+        """Last good reading for the warm-start snapshot"""
+        if not self.cached_data:
+            return None
+        return dict(self.cached_data, location=[self.latitude, self.longitude])
+
+    def restore_snapshot(self, data, fetched_at):
+        """Paint a saved reading until fresh data arrives"""
+        data = dict(data)
+        if data.pop('location', None) != [self.latitude, self.longitude]:
+            return
+        self.cached_data = data
+        self.last_update = fetched_at
+        self.first_update = False
+        self.stale = True
+        self._show_weather(data, age=time.time() - fetched_at)
 
-        except Exception as e:
-            print("Weather update failed:", e)
-            # Use cached data if available
-            if self.cached_data:
-                self.label.text = f'{self.cached_data["temp"]:.1f}°F and {self.cached_data["humidity"]}% humidity'
-            else:
-                self.label.text = f"Error: {e}"